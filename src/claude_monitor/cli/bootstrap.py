@@ -26,7 +26,7 @@ def setup_logging(
     if not disable_console:
         handlers.append(logging.StreamHandler(sys.stdout))
     if log_file:
-        handlers.append(logging.FileHandler(log_file))
+        handlers.append(logging.FileHandler(log_file, delay=True))
 
     if not handlers:
         handlers.append(logging.NullHandler())
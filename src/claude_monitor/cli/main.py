@@ -4,6 +4,7 @@ import argparse
 import contextlib
 import logging
 import sys
+import time
 import traceback
 from pathlib import Path
 from typing import Any, Callable, Dict, List, NoReturn, Optional, Union
@@ -17,9 +18,7 @@ from claude_monitor.cli.bootstrap import (
 )
 from claude_monitor.core.plans import Plans, PlanType, get_token_limit
 from claude_monitor.core.settings import Settings
-from claude_monitor.data.analysis import analyze_usage
 from claude_monitor.error_handling import report_error
-from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
 from claude_monitor.terminal.manager import (
     enter_alternate_screen,
     handle_cleanup_and_exit,
@@ -28,7 +27,6 @@ from claude_monitor.terminal.manager import (
     setup_terminal,
 )
 from claude_monitor.terminal.themes import get_themed_console, print_themed
-from claude_monitor.ui.display_controller import DisplayController
 
 # Type aliases for CLI callbacks
 DataUpdateCallback = Callable[[Dict[str, Any]], None]
@@ -103,6 +101,10 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 def _run_monitoring(args: argparse.Namespace) -> None:
     """Main monitoring implementation without facade."""
+    # Deferred so early exits don't import numpy and the analysis stack
+    from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
+    from claude_monitor.ui.display_controller import DisplayController
+
     if hasattr(args, "theme") and args.theme:
         console = get_themed_console(force_theme=args.theme.lower())
     else:
@@ -165,14 +167,13 @@ def _run_monitoring(args: argparse.Namespace) -> None:
                     data: Dict[str, Any] = monitoring_data.get("data", {})
                     blocks: List[Dict[str, Any]] = data.get("blocks", [])
 
-                    logger.debug(f"Display data has {len(blocks)} blocks")
-                    if blocks:
-                        active_blocks: List[Dict[str, Any]] = [
-                            b for b in blocks if b.get("isActive")
-                        ]
-                        logger.debug(f"Active blocks: {len(active_blocks)}")
-                        if active_blocks:
-                            total_tokens: int = active_blocks[0].get("totalTokens", 0)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Display data has {len(blocks)} blocks")
+                        active_block: Optional[Dict[str, Any]] = next(
+                            (b for b in blocks if b.get("isActive")), None
+                        )
+                        if active_block:
+                            total_tokens: int = active_block.get("totalTokens", 0)
                             logger.debug(f"Active block tokens: {total_tokens}")
 
                     renderable = display_controller.create_data_display(
@@ -215,8 +216,6 @@ def _run_monitoring(args: argparse.Namespace) -> None:
 
             # Main loop - live display is already active
             while True:
-                import time
-
                 time.sleep(1)
         finally:
             # Stop monitoring first
@@ -263,6 +262,8 @@ def _get_initial_token_limit(
             return custom_limit
 
         # Otherwise, analyze usage data to calculate P90
+        from claude_monitor.data.analysis import analyze_usage
+
         print_themed("Analyzing usage data to determine cost limits...", style="info")
 
         try:
@@ -1,8 +1,11 @@
 """Burn rate and cost calculations for Claude Monitor."""
 
 import logging
+import math
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+import numpy as np
 
 from claude_monitor.core.models import (
     BurnRate,
@@ -11,7 +14,7 @@ from claude_monitor.core.models import (
 )
 from claude_monitor.core.p90_calculator import P90Calculator
 from claude_monitor.error_handling import report_error
-from claude_monitor.utils.time_utils import TimezoneHandler
+from claude_monitor.utils.time_utils import parse_utc_timestamp
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -91,44 +94,125 @@ class BurnRateCalculator:
         )
 
 
+class _HourlyBurnRateCache:
+    """Holds the block arrays and per-minute burn rate of the last block list.
+
+    The monitor hands the same cached block list to every refresh until the
+    next fetch, so the arrays are built once per fetch rather than per tick,
+    and the burn rate, reported per minute, once per minute.
+    """
+
+    def __init__(self) -> None:
+        self._arrays_source: Optional[List[Dict[str, Any]]] = None
+        self._arrays: Tuple[np.ndarray, np.ndarray, np.ndarray] = (
+            np.empty(0),
+            np.empty(0),
+            np.empty(0),
+        )
+        self._rate_source: Optional[List[Dict[str, Any]]] = None
+        self._rate_minute: Optional[int] = None
+        self._rate: float = 0.0
+
+    def block_arrays(
+        self, blocks: List[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get block arrays, rebuilding them only when a new block list arrives."""
+        if blocks is not self._arrays_source:
+            self._arrays = _build_block_arrays(blocks)
+            self._arrays_source = blocks
+        return self._arrays
+
+    def burn_rate(self, blocks: List[Dict[str, Any]], current_time: datetime) -> float:
+        """Get the hourly burn rate, recomputing it at most once per minute."""
+        minute = int(current_time.timestamp() // 60)
+        if blocks is self._rate_source and minute == self._rate_minute:
+            return self._rate
+
+        one_hour_ago = current_time - timedelta(hours=1)
+        total_tokens = _calculate_total_tokens_in_hour(
+            blocks, one_hour_ago, current_time
+        )
+
+        self._rate = total_tokens / 60.0 if total_tokens > 0 else 0.0
+        self._rate_source = blocks
+        self._rate_minute = minute
+        return self._rate
+
+
+_burn_rate_cache: _HourlyBurnRateCache = _HourlyBurnRateCache()
+
+
 def calculate_hourly_burn_rate(
     blocks: List[Dict[str, Any]], current_time: datetime
 ) -> float:
-    """Calculate burn rate based on all sessions in the last hour."""
+    """Calculate burn rate based on all sessions in the last hour.
+
+    Burn rate is reported per minute, so refreshes within the same minute
+    on the same block list reuse the previously computed value.
+    """
     if not blocks:
         return 0.0
-
-    one_hour_ago = current_time - timedelta(hours=1)
-    total_tokens = _calculate_total_tokens_in_hour(blocks, one_hour_ago, current_time)
-
-    return total_tokens / 60.0 if total_tokens > 0 else 0.0
+    return _burn_rate_cache.burn_rate(blocks, current_time)
 
 
 def _calculate_total_tokens_in_hour(
     blocks: List[Dict[str, Any]], one_hour_ago: datetime, current_time: datetime
 ) -> float:
     """Calculate total tokens for all blocks in the last hour."""
-    total_tokens = 0.0
-    for block in blocks:
-        total_tokens += _process_block_for_burn_rate(block, one_hour_ago, current_time)
-    return total_tokens
-
+    starts, ends, totals = _burn_rate_cache.block_arrays(blocks)
 
-def _process_block_for_burn_rate(
-    block: Dict[str, Any], one_hour_ago: datetime, current_time: datetime
-) -> float:
-    """Process a single block for burn rate calculation."""
-    start_time = _parse_block_start_time(block)
-    if not start_time or block.get("isGap", False):
-        return 0
-
-    session_actual_end = _determine_session_end_time(block, current_time)
-    if session_actual_end < one_hour_ago:
-        return 0
-
-    return _calculate_tokens_in_hour(
-        block, start_time, session_actual_end, one_hour_ago, current_time
-    )
+    # Arrays are ordered by end time, so skip blocks that ended before the hour
+    first = int(np.searchsorted(ends, one_hour_ago.timestamp()))
+    if first >= len(ends):
+        return 0.0
+    starts, ends, totals = starts[first:], ends[first:], totals[first:]
+
+    now_ts = current_time.timestamp()
+    ends = np.where(np.isinf(ends), now_ts, ends)
+    overlap = np.minimum(ends, now_ts) - np.maximum(starts, one_hour_ago.timestamp())
+    durations = ends - starts
+    mask = (overlap > 0) & (durations > 0)
+    return float(np.sum(totals[mask] * overlap[mask] / durations[mask]))
+
+
+def _build_block_arrays(
+    blocks: List[Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collect epoch start/end seconds and token totals of non-gap blocks.
+
+    Uses the epoch fields precomputed by analysis when present and only
+    parses the ISO timestamps as a fallback. Blocks still open (active or
+    without a known end) get an infinite end, resolved to "now" per tick.
+    The arrays are sorted by end time.
+    """
+    rows: List[Tuple[float, float, float]] = []
+    for block in blocks:
+        get = block.get
+        if get("isGap", False):
+            continue
+        start_ts = get("startTimestamp")
+        if start_ts is None:
+            start_time = _parse_block_start_time(block)
+            if not start_time:
+                continue
+            start_ts = start_time.timestamp()
+
+        end_ts = math.inf
+        if not get("isActive", False):
+            end_ts = get("actualEndTimestamp")
+            if end_ts is None:
+                end_time = _parse_block_end_time(block)
+                end_ts = end_time.timestamp() if end_time else math.inf
+
+        rows.append((start_ts, end_ts, get("totalTokens", 0)))
+
+    if not rows:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty
+    starts, ends, totals = np.array(rows, dtype=np.float64).T
+
+    order = np.argsort(ends, kind="stable")
+    return starts[order], ends[order], totals[order]
 
 
 def _parse_block_start_time(block: Dict[str, Any]) -> Optional[datetime]:
@@ -137,54 +221,24 @@ def _parse_block_start_time(block: Dict[str, Any]) -> Optional[datetime]:
     if not start_time_str:
         return None
 
-    tz_handler = TimezoneHandler()
     try:
-        start_time = tz_handler.parse_timestamp(start_time_str)
-        return tz_handler.ensure_utc(start_time)
+        return parse_utc_timestamp(start_time_str)
     except (ValueError, TypeError, AttributeError) as e:
         _log_timestamp_error(e, start_time_str, block.get("id"), "start_time")
         return None
 
 
-def _determine_session_end_time(
-    block: Dict[str, Any], current_time: datetime
-) -> datetime:
-    """Determine session end time based on block status."""
-    if block.get("isActive", False):
-        return current_time
-
+def _parse_block_end_time(block: Dict[str, Any]) -> Optional[datetime]:
+    """Parse actual end time from block with error handling."""
     actual_end_str = block.get("actualEndTime")
-    if actual_end_str:
-        tz_handler = TimezoneHandler()
-        try:
-            session_actual_end = tz_handler.parse_timestamp(actual_end_str)
-            return tz_handler.ensure_utc(session_actual_end)
-        except (ValueError, TypeError, AttributeError) as e:
-            _log_timestamp_error(e, actual_end_str, block.get("id"), "actual_end_time")
-    return current_time
-
-
-def _calculate_tokens_in_hour(
-    block: Dict[str, Any],
-    start_time: datetime,
-    session_actual_end: datetime,
-    one_hour_ago: datetime,
-    current_time: datetime,
-) -> float:
-    """Calculate tokens used within the last hour for this session."""
-    session_start_in_hour = max(start_time, one_hour_ago)
-    session_end_in_hour = min(session_actual_end, current_time)
-
-    if session_end_in_hour <= session_start_in_hour:
-        return 0
-
-    total_session_duration = (session_actual_end - start_time).total_seconds() / 60
-    hour_duration = (session_end_in_hour - session_start_in_hour).total_seconds() / 60
+    if not actual_end_str:
+        return None
 
-    if total_session_duration > 0:
-        session_tokens = block.get("totalTokens", 0)
-        return session_tokens * (hour_duration / total_session_duration)
-    return 0
+    try:
+        return parse_utc_timestamp(actual_end_str)
+    except (ValueError, TypeError, AttributeError) as e:
+        _log_timestamp_error(e, actual_end_str, block.get("id"), "actual_end_time")
+        return None
 
 
 def _log_timestamp_error(
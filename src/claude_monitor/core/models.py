@@ -2,6 +2,7 @@
 Core data structures for usage tracking, session management, and token calculations.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -16,19 +17,38 @@ class CostMode(Enum):
     CALCULATED = "calculate"
 
 
-@dataclass
-class UsageEntry:
-    """Individual usage record from Claude usage data."""
-
-    timestamp: datetime
-    input_tokens: int
-    output_tokens: int
-    cache_creation_tokens: int = 0
-    cache_read_tokens: int = 0
-    cost_usd: float = 0.0
-    model: str = ""
-    message_id: str = ""
-    request_id: str = ""
+# Slots save ~48 bytes per entry; dataclass(slots=True) needs Python 3.10+
+if sys.version_info >= (3, 10):
+
+    @dataclass(slots=True)
+    class UsageEntry:
+        """Individual usage record from Claude usage data."""
+
+        timestamp: datetime
+        input_tokens: int
+        output_tokens: int
+        cache_creation_tokens: int = 0
+        cache_read_tokens: int = 0
+        cost_usd: float = 0.0
+        model: str = ""
+        message_id: str = ""
+        request_id: str = ""
+
+else:
+
+    @dataclass
+    class UsageEntry:
+        """Individual usage record from Claude usage data."""
+
+        timestamp: datetime
+        input_tokens: int
+        output_tokens: int
+        cache_creation_tokens: int = 0
+        cache_read_tokens: int = 0
+        cost_usd: float = 0.0
+        model: str = ""
+        message_id: str = ""
+        request_id: str = ""
 
 
 @dataclass
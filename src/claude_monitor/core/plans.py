@@ -6,6 +6,7 @@ Shared constants (defaults, common limits, threshold) are exposed on the Plans c
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
@@ -110,8 +111,13 @@ class Plans:
         return cls._build_config(plan_type)
 
     @classmethod
+    @lru_cache(maxsize=32)
     def get_plan_by_name(cls, name: str) -> Optional[PlanConfig]:
-        """Get PlanConfig by its string name (case-insensitive)."""
+        """Get PlanConfig by its string name (case-insensitive).
+
+        Configs are immutable, so lookups are memoized per name; the plan
+        limit getters call this on every refresh.
+        """
         try:
             pt = PlanType.from_string(name)
             return cls.get_plan(pt)
@@ -6,7 +6,8 @@ based on token usage and model pricing. It supports all Claude model types
 with caching.
 """
 
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from claude_monitor.core.models import CostMode, TokenCounts, normalize_model_name
 
@@ -26,6 +27,9 @@ class PricingCalculator:
     - Backward compatible with both APIs
     """
 
+    # Maximum number of memoized cost results kept (least recently used evicted)
+    MAX_COST_CACHE_SIZE: int = 4096
+
     FALLBACK_PRICING: Dict[str, Dict[str, float]] = {
         "opus": {
             "input": 15.0,
@@ -66,7 +70,9 @@ class PricingCalculator:
             "claude-sonnet-4-20250514": self.FALLBACK_PRICING["sonnet"],
             "claude-opus-4-20250514": self.FALLBACK_PRICING["opus"],
         }
-        self._cost_cache: Dict[str, float] = {}
+        self._cost_cache: "OrderedDict[Tuple[str, int, int, int, int], float]" = (
+            OrderedDict()
+        )
 
     def calculate_cost(
         self,
@@ -104,13 +110,18 @@ class PricingCalculator:
 
         # Create cache key
         cache_key = (
-            f"{model}:{input_tokens}:{output_tokens}:"
-            f"{cache_creation_tokens}:{cache_read_tokens}"
+            model,
+            input_tokens,
+            output_tokens,
+            cache_creation_tokens,
+            cache_read_tokens,
         )
 
         # Check cache
-        if cache_key in self._cost_cache:
-            return self._cost_cache[cache_key]
+        cached = self._cost_cache.get(cache_key)
+        if cached is not None:
+            self._cost_cache.move_to_end(cache_key)
+            return cached
 
         # Get pricing for model
         pricing = self._get_pricing_for_model(model, strict=strict)
@@ -128,8 +139,10 @@ class PricingCalculator:
         # Round to 6 decimal places
         cost = round(cost, 6)
 
-        # Cache result
+        # Cache result, evicting the least recently used entry when full
         self._cost_cache[cache_key] = cost
+        if len(self._cost_cache) > self.MAX_COST_CACHE_SIZE:
+            self._cost_cache.popitem(last=False)
         return cost
 
     def _get_pricing_for_model(
@@ -150,23 +163,14 @@ class PricingCalculator:
         # Try normalized model name first
         normalized = normalize_model_name(model)
 
-        # Check configured pricing
-        if normalized in self.pricing:
-            pricing = self.pricing[normalized]
+        # Check configured pricing, then the original model name
+        pricing = self.pricing.get(normalized)
+        if pricing is None:
+            pricing = self.pricing.get(model)
+        if pricing is not None:
             # Ensure cache pricing exists
-            if "cache_creation" not in pricing:
-                pricing["cache_creation"] = pricing["input"] * 1.25
-            if "cache_read" not in pricing:
-                pricing["cache_read"] = pricing["input"] * 0.1
-            return pricing
-
-        # Check original model name
-        if model in self.pricing:
-            pricing = self.pricing[model]
-            if "cache_creation" not in pricing:
-                pricing["cache_creation"] = pricing["input"] * 1.25
-            if "cache_read" not in pricing:
-                pricing["cache_read"] = pricing["input"] * 0.1
+            pricing.setdefault("cache_creation", pricing["input"] * 1.25)
+            pricing.setdefault("cache_read", pricing["input"] * 0.1)
             return pricing
 
         # If strict mode, raise KeyError for unknown models
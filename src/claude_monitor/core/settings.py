@@ -196,7 +196,7 @@ class Settings(BaseSettings):
     @classmethod
     def validate_timezone(cls, v: str) -> str:
         """Validate timezone."""
-        if v not in ["local", "auto"] and v not in pytz.all_timezones:
+        if v not in ["local", "auto"] and v not in pytz.all_timezones_set:
             raise ValueError(f"Invalid timezone: {v}")
         return v
 
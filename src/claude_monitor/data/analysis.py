@@ -185,6 +185,10 @@ def _create_base_block_dict(block: SessionBlock) -> Dict[str, Any]:
         "actualEndTime": (
             block.actual_end_time.isoformat() if block.actual_end_time else None
         ),
+        "startTimestamp": block.start_time.timestamp(),
+        "actualEndTimestamp": (
+            block.actual_end_time.timestamp() if block.actual_end_time else None
+        ),
         "tokenCounts": {
             "inputTokens": block.token_counts.input_tokens,
             "outputTokens": block.token_counts.output_tokens,
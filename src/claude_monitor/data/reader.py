@@ -114,6 +114,30 @@ def load_all_raw_entries(data_path: Optional[str] = None) -> List[Dict[str, Any]
     return all_raw_entries
 
 
+def get_data_signature(data_path: Optional[str] = None) -> Tuple[int, float, int]:
+    """Summarize the JSONL files under the data directory for change detection.
+
+    Args:
+        data_path: Path to Claude data directory (defaults to ~/.claude/projects)
+
+    Returns:
+        Tuple of (file count, latest modification time, total size in bytes)
+    """
+    path = Path(data_path if data_path else "~/.claude/projects").expanduser()
+    file_count = 0
+    latest_mtime = 0.0
+    total_size = 0
+    for file_path in _find_jsonl_files(path):
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        file_count += 1
+        latest_mtime = max(latest_mtime, stat.st_mtime)
+        total_size += stat.st_size
+    return file_count, latest_mtime, total_size
+
+
 def _find_jsonl_files(data_path: Path) -> List[Path]:
     """Find all .jsonl files in the data directory."""
     if not data_path.exists():
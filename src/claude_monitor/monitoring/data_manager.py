@@ -2,9 +2,10 @@
 
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from claude_monitor.data.analysis import analyze_usage
+from claude_monitor.data.reader import get_data_signature
 from claude_monitor.error_handling import report_error
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,7 @@ class DataManager:
         cache_ttl: int = 30,
         hours_back: int = 192,
         data_path: Optional[str] = None,
+        unchanged_cache_ttl: int = 60,
     ) -> None:
         """Initialize data manager with cache and fetch settings.
 
@@ -25,10 +27,16 @@ class DataManager:
             cache_ttl: Cache time-to-live in seconds
             hours_back: Hours of historical data to fetch
             data_path: Path to data directory
+            unchanged_cache_ttl: Maximum cache age in seconds while the
+                underlying data files are unchanged
         """
         self.cache_ttl: int = cache_ttl
+        self.unchanged_cache_ttl: int = unchanged_cache_ttl
         self._cache: Optional[Dict[str, Any]] = None
         self._cache_timestamp: Optional[float] = None
+        self._cache_expires_at: float = 0.0
+        self._unchanged_expires_at: float = 0.0
+        self._cache_signature: Optional[Tuple[int, float, int]] = None
 
         self.hours_back: int = hours_back
         self.data_path: Optional[str] = data_path
@@ -45,10 +53,15 @@ class DataManager:
             Usage data dictionary or None if fetch fails
         """
         if not force_refresh and self._is_cache_valid():
-            cache_age: float = time.time() - self._cache_timestamp  # type: ignore
+            cache_age: float = time.monotonic() - self._cache_timestamp  # type: ignore
             logger.debug(f"Using cached data (age: {cache_age:.1f}s)")
             return self._cache
 
+        signature: Optional[Tuple[int, float, int]] = self._get_signature()
+        if not force_refresh and self._is_source_unchanged(signature):
+            logger.debug("Data files unchanged, reusing cached data")
+            return self._cache
+
         max_retries: int = 3
         for attempt in range(max_retries):
             try:
@@ -64,6 +77,7 @@ class DataManager:
 
                 if data is not None:
                     self._set_cache(data)
+                    self._cache_signature = signature
                     self._last_successful_fetch = time.time()
                     self._last_error = None
                     return data
@@ -113,27 +127,50 @@ class DataManager:
         """Invalidate the cache."""
         self._cache = None
         self._cache_timestamp = None
+        self._cache_expires_at = 0.0
+        self._unchanged_expires_at = 0.0
+        self._cache_signature = None
         logger.debug("Cache invalidated")
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid."""
-        if self._cache is None or self._cache_timestamp is None:
+        return self._cache is not None and time.monotonic() <= self._cache_expires_at
+
+    def _get_signature(self) -> Optional[Tuple[int, float, int]]:
+        """Get the current data file signature, or None if it cannot be read."""
+        try:
+            return get_data_signature(self.data_path)
+        except OSError as e:
+            logger.debug(f"Could not stat data files: {e}")
+            return None
+
+    def _is_source_unchanged(
+        self, signature: Optional[Tuple[int, float, int]]
+    ) -> bool:
+        """Check if cached data can be reused because no data file changed."""
+        if (
+            signature is None
+            or self._cache is None
+            or signature != self._cache_signature
+        ):
             return False
 
-        cache_age = time.time() - self._cache_timestamp
-        return cache_age <= self.cache_ttl
+        return time.monotonic() <= self._unchanged_expires_at
 
     def _set_cache(self, data: Dict[str, Any]) -> None:
-        """Set cache with current timestamp."""
+        """Set cache with current monotonic timestamp and expiry deadlines."""
+        now = time.monotonic()
         self._cache = data
-        self._cache_timestamp = time.time()
+        self._cache_timestamp = now
+        self._cache_expires_at = now + self.cache_ttl
+        self._unchanged_expires_at = now + self.unchanged_cache_ttl
 
     @property
     def cache_age(self) -> float:
         """Get age of cached data in seconds."""
         if self._cache_timestamp is None:
             return float("inf")
-        return time.time() - self._cache_timestamp
+        return time.monotonic() - self._cache_timestamp
 
     @property
     def last_error(self) -> Optional[str]:
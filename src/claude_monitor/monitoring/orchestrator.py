@@ -16,6 +16,10 @@ logger = logging.getLogger(__name__)
 class MonitoringOrchestrator:
     """Orchestrates monitoring components following SRP."""
 
+    # Upper bound for the polling interval while no session is active; also
+    # the worst-case delay before a newly started session is picked up
+    MAX_IDLE_INTERVAL: float = 10.0
+
     def __init__(
         self, update_interval: int = 10, data_path: Optional[str] = None
     ) -> None:
@@ -37,6 +41,9 @@ class MonitoringOrchestrator:
         self._last_valid_data: Optional[Dict[str, Any]] = None
         self._args: Optional[Any] = None
         self._first_data_event: threading.Event = threading.Event()
+        self._custom_limit_blocks: Optional[List[Any]] = None
+        self._custom_limit: int = DEFAULT_TOKEN_LIMIT
+        self._idle_backoff: int = 1
 
     def start(self) -> None:
         """Start monitoring."""
@@ -127,7 +134,7 @@ class MonitoringOrchestrator:
 
         while self._monitoring:
             # Wait for interval or stop
-            if self._stop_event.wait(timeout=self.update_interval):
+            if self._stop_event.wait(timeout=self._next_interval()):
                 if not self._monitoring:
                     break
 
@@ -136,6 +143,27 @@ class MonitoringOrchestrator:
 
         logger.info("Monitoring loop ended")
 
+    def _next_interval(self) -> float:
+        """Get seconds to wait before the next update.
+
+        Polls at update_interval while a session is active and backs off
+        exponentially, up to MAX_IDLE_INTERVAL, while there is none. The
+        backoff only resets after the current wait, so a session started
+        while idle is detected within max(update_interval, MAX_IDLE_INTERVAL)
+        seconds.
+
+        Returns:
+            Seconds until the next fetch
+        """
+        if self.session_monitor.current_session_id is not None:
+            self._idle_backoff = 1
+            return self.update_interval
+
+        interval: float = self.update_interval * self._idle_backoff
+        if interval < self.MAX_IDLE_INTERVAL:
+            self._idle_backoff *= 2
+        return max(self.update_interval, min(interval, self.MAX_IDLE_INTERVAL))
+
     def _fetch_and_process_data(
         self, force_refresh: bool = False
     ) -> Optional[Dict[str, Any]]:
@@ -226,7 +254,11 @@ class MonitoringOrchestrator:
         try:
             if plan == "custom":
                 blocks: List[Any] = data.get("blocks", [])
-                return get_token_limit(plan, blocks)
+                # Cached data is reused between ticks, so only rescan new blocks
+                if blocks is not self._custom_limit_blocks:
+                    self._custom_limit = get_token_limit(plan, blocks)
+                    self._custom_limit_blocks = blocks
+                return self._custom_limit
             return get_token_limit(plan)
         except Exception as e:
             logger.exception(f"Error calculating token limit: {e}")
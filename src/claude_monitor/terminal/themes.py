@@ -5,6 +5,7 @@ import os
 import re
 import sys
 import threading
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -456,6 +457,7 @@ class ThemeManager:
         self._lock = threading.Lock()
         self._current_theme: Optional[ThemeConfig] = None
         self._forced_theme: Optional[str] = None
+        self._consoles: Dict[str, Console] = {}
         self.themes = self._load_themes()
 
     def _load_themes(self) -> Dict[str, ThemeConfig]:
@@ -588,10 +590,16 @@ class ThemeManager:
             force_detection: Force re-detection of terminal background.
 
         Returns:
-            Rich Console instance configured with the selected theme.
+            Rich Console instance configured with the selected theme, shared
+            between calls that resolve to the same theme.
         """
         theme: ThemeConfig = self.get_theme(theme_name, force_detection)
-        return Console(theme=theme.rich_theme, force_terminal=True)
+        with self._lock:
+            console: Optional[Console] = self._consoles.get(theme.name)
+            if console is None:
+                console = Console(theme=theme.rich_theme, force_terminal=True)
+                self._consoles[theme.name] = console
+            return console
 
     def get_current_theme(self) -> Optional[ThemeConfig]:
         """Get currently active theme.
@@ -624,6 +632,15 @@ VELOCITY_INDICATORS: Dict[str, Dict[str, Union[str, float]]] = {
     "very_fast": {"emoji": "⚡", "label": "Very fast", "threshold": float("inf")},
 }
 
+# Ascending thresholds and matching (emoji, label) pairs for bisect lookups
+_VELOCITY_THRESHOLDS: Tuple[float, ...] = tuple(
+    float(indicator["threshold"]) for indicator in VELOCITY_INDICATORS.values()
+)
+_VELOCITY_LABELS: Tuple[Tuple[str, str], ...] = tuple(
+    (str(indicator["emoji"]), str(indicator["label"]))
+    for indicator in VELOCITY_INDICATORS.values()
+)
+
 
 # Helper functions for style selection
 def get_cost_style(cost: float) -> str:
@@ -650,12 +667,11 @@ def get_velocity_indicator(burn_rate: float) -> Dict[str, str]:
     Returns:
         Dictionary with 'emoji' and 'label' keys for the velocity category.
     """
-    for indicator in VELOCITY_INDICATORS.values():
-        threshold_value = indicator["threshold"]
-        if isinstance(threshold_value, (int, float)) and burn_rate < threshold_value:
-            return {"emoji": str(indicator["emoji"]), "label": str(indicator["label"])}
-    very_fast = VELOCITY_INDICATORS["very_fast"]
-    return {"emoji": str(very_fast["emoji"]), "label": str(very_fast["label"])}
+    index = min(
+        bisect_right(_VELOCITY_THRESHOLDS, burn_rate), len(_VELOCITY_LABELS) - 1
+    )
+    emoji, label = _VELOCITY_LABELS[index]
+    return {"emoji": emoji, "label": label}
 
 
 # Global theme manager instance
@@ -8,7 +8,6 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import pytz
 from rich.console import Console, Group, RenderableType
 from rich.live import Live
 from rich.text import Text
@@ -25,9 +24,10 @@ from claude_monitor.ui.layouts import ScreenManager
 from claude_monitor.ui.session_display import SessionDisplayComponent
 from claude_monitor.utils.notifications import NotificationManager
 from claude_monitor.utils.time_utils import (
-    TimezoneHandler,
     format_display_time,
+    get_display_timezone,
     get_time_format_preference,
+    parse_utc_timestamp,
     percentage,
 )
 
@@ -43,6 +43,8 @@ class DisplayController:
         self.screen_manager = ScreenManager()
         self.live_manager = LiveDisplayManager()
         self.advanced_custom_display = None
+        self._custom_p90_blocks: Optional[List[Dict[str, Any]]] = None
+        self._custom_p90_limits: Tuple[float, float] = (0.0, 0.0)
         self.buffer_manager = ScreenBufferManager()
         self.session_calculator = SessionCalculator()
         config_dir = Path.home() / ".claude" / "config"
@@ -61,6 +63,27 @@ class DisplayController:
             "end_time_str": active_block.get("endTime"),
         }
 
+    def _get_custom_p90_limits(
+        self, blocks: List[Dict[str, Any]]
+    ) -> Tuple[float, float]:
+        """Get P90 cost and message limits for the custom plan.
+
+        The session scan only changes when a new block list is fetched, so the
+        limits are recomputed once per fetch rather than on every refresh.
+        """
+        if blocks is not self._custom_p90_blocks:
+            temp_display = AdvancedCustomLimitDisplay(None)
+            session_data = temp_display._collect_session_data(blocks)
+            percentiles = temp_display._calculate_session_percentiles(
+                session_data["limit_sessions"]
+            )
+            self._custom_p90_limits = (
+                percentiles["costs"]["p90"],
+                percentiles["messages"]["p90"],
+            )
+            self._custom_p90_blocks = blocks
+        return self._custom_p90_limits
+
     def _calculate_token_limits(self, args: Any, token_limit: int) -> Tuple[int, int]:
         """Calculate token limits based on plan and arguments."""
         if (
@@ -103,14 +126,17 @@ class DisplayController:
         cost_limit: float,
         predicted_end_time: datetime,
         reset_time: datetime,
+        current_time: datetime,
     ) -> Dict[str, bool]:
         """Check and update notification states."""
         notifications = {}
+        # Notification timestamps are stored as local naive times
+        now = current_time.astimezone().replace(tzinfo=None)
 
         # Switch to custom notification
         switch_condition = token_limit > original_limit
         if switch_condition and self.notification_manager.should_notify(
-            "switch_to_custom"
+            "switch_to_custom", current_time=now
         ):
             self.notification_manager.mark_notified("switch_to_custom")
             notifications["show_switch_notification"] = True
@@ -123,7 +149,7 @@ class DisplayController:
         # Exceed limit notification
         exceed_condition = session_cost > cost_limit
         if exceed_condition and self.notification_manager.should_notify(
-            "exceed_max_limit"
+            "exceed_max_limit", current_time=now
         ):
             self.notification_manager.mark_notified("exceed_max_limit")
             notifications["show_exceed_notification"] = True
@@ -136,7 +162,7 @@ class DisplayController:
         # Cost will exceed notification
         run_out_condition = predicted_end_time < reset_time
         if run_out_condition and self.notification_manager.should_notify(
-            "cost_will_exceed"
+            "cost_will_exceed", current_time=now
         ):
             self.notification_manager.mark_notified("cost_will_exceed")
             notifications["show_cost_will_exceed"] = True
@@ -156,18 +182,10 @@ class DisplayController:
         reset_time: datetime,
     ) -> Dict[str, str]:
         """Format times for display."""
-        tz_handler = TimezoneHandler(default_tz="Europe/Warsaw")
-        timezone_to_use = (
-            args.timezone
-            if tz_handler.validate_timezone(args.timezone)
-            else "Europe/Warsaw"
-        )
-
-        # Convert times to display timezone
-        predicted_end_local = tz_handler.convert_to_timezone(
-            predicted_end_time, timezone_to_use
-        )
-        reset_time_local = tz_handler.convert_to_timezone(reset_time, timezone_to_use)
+        # Convert times to display timezone (unknown names fall back to Warsaw)
+        display_tz = get_display_timezone(args.timezone)
+        predicted_end_local = predicted_end_time.astimezone(display_tz)
+        reset_time_local = reset_time.astimezone(display_tz)
 
         # Format times
         time_format = get_time_format_preference(args)
@@ -179,11 +197,6 @@ class DisplayController:
         )
 
         # Current time display
-        try:
-            display_tz = pytz.timezone(args.timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
-            display_tz = pytz.timezone("Europe/Warsaw")
-
         current_time_display = current_time.astimezone(display_tz)
         current_time_str = format_display_time(
             current_time_display, time_format, include_seconds=True
@@ -222,7 +235,7 @@ class DisplayController:
                 break
 
         # Use UTC timezone for time calculations
-        current_time = datetime.now(pytz.UTC)
+        current_time = datetime.now(timezone.utc)
 
         if not active_block:
             screen_buffer = self.session_display.format_no_active_session_screen(
@@ -234,13 +247,9 @@ class DisplayController:
         messages_limit_p90 = None
 
         if args.plan == "custom":
-            temp_display = AdvancedCustomLimitDisplay(None)
-            session_data = temp_display._collect_session_data(data["blocks"])
-            percentiles = temp_display._calculate_session_percentiles(
-                session_data["limit_sessions"]
+            cost_limit_p90, messages_limit_p90 = self._get_custom_p90_limits(
+                data["blocks"]
             )
-            cost_limit_p90 = percentiles["costs"]["p90"]
-            messages_limit_p90 = percentiles["messages"]["p90"]
         else:
             # Use centralized cost limits
             from claude_monitor.core.plans import get_cost_limit
@@ -360,6 +369,7 @@ class DisplayController:
             cost_data["cost_limit"],
             cost_data["predicted_end_time"],
             time_data["reset_time"],
+            current_time,
         )
 
         # Format display times
@@ -549,16 +559,22 @@ class ScreenBufferManager:
         if self.console is None:
             self.console = get_themed_console()
 
-        text_objects = []
+        # Parse consecutive markup lines as one Text instead of one per line
+        renderables: List[RenderableType] = []
+        pending_lines: List[str] = []
         for line in screen_buffer:
             if isinstance(line, str):
-                # Use console to render markup properly
-                text_obj = Text.from_markup(line)
-                text_objects.append(text_obj)
-            else:
-                text_objects.append(line)
+                pending_lines.append(line)
+                continue
+            if pending_lines:
+                renderables.append(Text.from_markup("\n".join(pending_lines)))
+                pending_lines = []
+            renderables.append(line)
+
+        if pending_lines:
+            renderables.append(Text.from_markup("\n".join(pending_lines)))
 
-        return Group(*text_objects)
+        return Group(*renderables)
 
 
 # Legacy functions for backward compatibility
@@ -575,10 +591,6 @@ class SessionCalculator:
     """Handles session-related calculations for display purposes.
     (Moved from ui/calculators.py)"""
 
-    def __init__(self) -> None:
-        """Initialize session calculator."""
-        self.tz_handler = TimezoneHandler()
-
     def calculate_time_data(
         self, session_data: Dict[str, Any], current_time: datetime
     ) -> Dict[str, Any]:
@@ -594,13 +606,11 @@ class SessionCalculator:
         # Parse start time
         start_time = None
         if session_data.get("start_time_str"):
-            start_time = self.tz_handler.parse_timestamp(session_data["start_time_str"])
-            start_time = self.tz_handler.ensure_utc(start_time)
+            start_time = parse_utc_timestamp(session_data["start_time_str"])
 
         # Calculate reset time
         if session_data.get("end_time_str"):
-            reset_time = self.tz_handler.parse_timestamp(session_data["end_time_str"])
-            reset_time = self.tz_handler.ensure_utc(reset_time)
+            reset_time = parse_utc_timestamp(session_data["end_time_str"])
         else:
             reset_time = (
                 start_time + timedelta(hours=5)  # Default session duration
@@ -621,6 +631,7 @@ class SessionCalculator:
             elapsed_session_minutes = max(0, total_session_minutes - minutes_to_reset)
 
         return {
+            "current_time": current_time,
             "start_time": start_time,
             "reset_time": reset_time,
             "minutes_to_reset": minutes_to_reset,
@@ -646,7 +657,8 @@ class SessionCalculator:
         """
         elapsed_minutes = time_data["elapsed_session_minutes"]
         session_cost = session_data.get("session_cost", 0.0)
-        current_time = datetime.now(timezone.utc)
+        # Reuse the tick's timestamp captured in calculate_time_data
+        current_time = time_data.get("current_time") or datetime.now(timezone.utc)
 
         # Calculate cost per minute
         cost_per_minute = (
@@ -7,6 +7,7 @@ This module consolidates layout management functionality including:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final, Sequence
 
 
@@ -35,16 +36,22 @@ class HeaderManager:
         Returns:
             List of formatted header lines
         """
-        sparkles: str = self.DEFAULT_SPARKLES
-        title: str = "CLAUDE CODE USAGE MONITOR"
         separator: str = self.separator_char * self.separator_length
+        return list(_build_header(plan, timezone, separator))
 
-        return [
-            f"[header]{sparkles}[/] [header]{title}[/] [header]{sparkles}[/]",
-            f"[table.border]{separator}[/]",
-            f"[ {plan.lower()} | {timezone.lower()} ]",
-            "",
-        ]
+
+@lru_cache(maxsize=8)
+def _build_header(plan: str, timezone: str, separator: str) -> tuple[str, ...]:
+    """Build header lines once per plan/timezone/separator combination."""
+    sparkles: str = HeaderManager.DEFAULT_SPARKLES
+    title: str = "CLAUDE CODE USAGE MONITOR"
+
+    return (
+        f"[header]{sparkles}[/] [header]{title}[/] [header]{sparkles}[/]",
+        f"[table.border]{separator}[/]",
+        f"[ {plan.lower()} | {timezone.lower()} ]",
+        "",
+    )
 
 
 class ScreenManager:
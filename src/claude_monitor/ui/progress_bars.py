@@ -6,9 +6,10 @@ Provides token usage, time progress, and model usage progress bars.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Final, Protocol, TypedDict
 
-from claude_monitor.utils.time_utils import percentage
+from claude_monitor.utils.time_utils import format_time, percentage
 
 
 # Type definitions for progress bar components
@@ -37,6 +38,14 @@ class ThresholdConfig(TypedDict):
     style: str
 
 
+@lru_cache(maxsize=256)
+def _bar_segments(
+    filled: int, width: int, filled_char: str, empty_char: str
+) -> tuple[str, str]:
+    """Build the filled and empty segment strings for a bar fill level."""
+    return filled_char * filled, empty_char * (width - filled)
+
+
 class ProgressBarRenderer(Protocol):
     """Protocol for progress bar rendering."""
 
@@ -113,8 +122,9 @@ class BaseProgressBar(ABC):
         Returns:
             Formatted bar string
         """
-        filled_bar: str = filled_char * filled
-        empty_bar: str = empty_char * (self.width - filled)
+        filled_bar, empty_bar = _bar_segments(
+            filled, self.width, filled_char, empty_char
+        )
 
         if filled_style:
             filled_bar = f"[{filled_style}]{filled_bar}[/]"
@@ -135,23 +145,6 @@ class BaseProgressBar(ABC):
         """
         return f"{percentage:.{precision}f}%"
 
-    def _get_color_style_by_threshold(
-        self, value: float, thresholds: list[tuple[float, str]]
-    ) -> str:
-        """Get color style based on value thresholds.
-
-        Args:
-            value: Current value to check
-            thresholds: List of (threshold, style) tuples in descending order
-
-        Returns:
-            Style string for the current value
-        """
-        for threshold, style in thresholds:
-            if value >= threshold:
-                return style
-        return thresholds[-1][1] if thresholds else ""
-
     @abstractmethod
     def render(self, *args, **kwargs) -> str:
         """Render the progress bar.
@@ -169,7 +162,6 @@ class TokenProgressBar(BaseProgressBar):
     # Color threshold constants
     HIGH_USAGE_THRESHOLD: Final[float] = 90.0
     MEDIUM_USAGE_THRESHOLD: Final[float] = 50.0
-    LOW_USAGE_THRESHOLD: Final[float] = 0.0
 
     # Style constants
     HIGH_USAGE_STYLE: Final[str] = "cost.high"
@@ -182,6 +174,13 @@ class TokenProgressBar(BaseProgressBar):
     MEDIUM_USAGE_ICON: Final[str] = "🟡"
     LOW_USAGE_ICON: Final[str] = "🟢"
 
+    # (filled style, empty style, icon) per tier, indexed by thresholds crossed
+    USAGE_TIERS: Final[tuple[tuple[str, str, str], ...]] = (
+        (LOW_USAGE_STYLE, BORDER_STYLE, LOW_USAGE_ICON),
+        (MEDIUM_USAGE_STYLE, BORDER_STYLE, MEDIUM_USAGE_ICON),
+        (HIGH_USAGE_STYLE, MEDIUM_USAGE_STYLE, HIGH_USAGE_ICON),
+    )
+
     def render(self, percentage: float) -> str:
         """Render token usage progress bar.
 
@@ -193,30 +192,14 @@ class TokenProgressBar(BaseProgressBar):
         """
         filled: int = self._calculate_filled_segments(min(percentage, 100.0))
 
-        color_thresholds: list[tuple[float, str]] = [
-            (self.HIGH_USAGE_THRESHOLD, self.HIGH_USAGE_STYLE),
-            (self.MEDIUM_USAGE_THRESHOLD, self.MEDIUM_USAGE_STYLE),
-            (self.LOW_USAGE_THRESHOLD, self.LOW_USAGE_STYLE),
-        ]
-
-        filled_style: str = self._get_color_style_by_threshold(
-            percentage, color_thresholds
+        tier: int = (percentage >= self.MEDIUM_USAGE_THRESHOLD) + (
+            percentage >= self.HIGH_USAGE_THRESHOLD
         )
+        filled_style, empty_style, icon = self.USAGE_TIERS[tier]
         bar: str = self._render_bar(
-            filled,
-            filled_style=filled_style,
-            empty_style=self.BORDER_STYLE
-            if percentage < self.HIGH_USAGE_THRESHOLD
-            else self.MEDIUM_USAGE_STYLE,
+            filled, filled_style=filled_style, empty_style=empty_style
         )
 
-        if percentage >= self.HIGH_USAGE_THRESHOLD:
-            icon: str = self.HIGH_USAGE_ICON
-        elif percentage >= self.MEDIUM_USAGE_THRESHOLD:
-            icon = self.MEDIUM_USAGE_ICON
-        else:
-            icon = self.LOW_USAGE_ICON
-
         percentage_str: str = self._format_percentage(percentage)
         return f"{icon} [{bar}] {percentage_str}"
 
@@ -234,8 +217,6 @@ class TimeProgressBar(BaseProgressBar):
         Returns:
             Formatted time progress bar string
         """
-        from claude_monitor.utils.time_utils import format_time
-
         if total_minutes <= 0:
             progress_percentage = 0
         else:
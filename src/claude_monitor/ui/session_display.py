@@ -5,10 +5,13 @@ Handles formatting of active session screens and session data display.
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 import pytz
 
+from claude_monitor.core.plans import DEFAULT_COST_LIMIT
+from claude_monitor.terminal.themes import get_cost_style
 from claude_monitor.ui.components import CostIndicator, VelocityIndicator
 from claude_monitor.ui.layouts import HeaderManager
 from claude_monitor.ui.progress_bars import (
@@ -18,10 +21,35 @@ from claude_monitor.ui.progress_bars import (
 )
 from claude_monitor.utils.time_utils import (
     format_display_time,
+    get_display_timezone,
     get_time_format_preference,
     percentage,
 )
 
+# Plans whose screen shows P90-based cost/message limit bars
+P90_LIMIT_PLANS = frozenset(("custom", "pro", "max5", "max20"))
+
+SEPARATOR_LINE = f"[separator]{'─' * 60}[/]"
+
+# Wide bar icons indexed by usage thresholds crossed (50%, 80%)
+WIDE_BAR_ICONS = ("🟢", "🟡", "🔴")
+
+EXCEED_LIMIT_NOTIFICATION = "⚠️  [error]You have exceeded the maximum cost limit![/]"
+COST_WILL_EXCEED_NOTIFICATION = "⏰ [warning]Cost limit will be exceeded before reset![/]"
+
+CUSTOM_LIMITS_HEADER = (
+    "",
+    "[bold]📊 Session-Based Dynamic Limits[/bold]",
+    "[dim]Based on your historical usage patterns when hitting limits (P90)[/dim]",
+    SEPARATOR_LINE,
+)
+
+
+@lru_cache(maxsize=4)
+def _switch_notification(token_limit: int) -> str:
+    """Format the plan switch notification for a token limit."""
+    return f"🔄 [warning]Token limit exceeded ({token_limit:,} tokens)[/]"
+
 
 @dataclass
 class SessionDisplayData:
@@ -60,6 +88,7 @@ class SessionDisplayComponent:
         self.token_progress = TokenProgressBar()
         self.time_progress = TimeProgressBar()
         self.model_usage = ModelUsageBar()
+        self.wide_progress = TokenProgressBar(width=50)
 
     def _render_wide_progress_bar(self, percentage: float) -> str:
         """Render a wide progress bar (50 chars) using centralized progress bar logic.
@@ -70,16 +99,9 @@ class SessionDisplayComponent:
         Returns:
             Formatted progress bar string
         """
-        from claude_monitor.terminal.themes import get_cost_style
-
-        if percentage < 50:
-            color = "🟢"
-        elif percentage < 80:
-            color = "🟡"
-        else:
-            color = "🔴"
+        color = WIDE_BAR_ICONS[(percentage >= 50) + (percentage >= 80)]
 
-        progress_bar = TokenProgressBar(width=50)
+        progress_bar = self.wide_progress
         bar_style = get_cost_style(percentage)
 
         capped_percentage = min(percentage, 100.0)
@@ -179,121 +201,92 @@ class SessionDisplayComponent:
         Returns:
             List of formatted screen lines
         """
-
         screen_buffer = []
 
         header_manager = HeaderManager()
         screen_buffer.extend(header_manager.create_header(plan, timezone))
 
-        if plan in ["custom", "pro", "max5", "max20"]:
-            from claude_monitor.core.plans import DEFAULT_COST_LIMIT
+        velocity_emoji = VelocityIndicator.get_velocity_emoji(burn_rate)
+        cost_per_min = (
+            session_cost / max(1, elapsed_session_minutes)
+            if elapsed_session_minutes > 0
+            else 0
+        )
+        cost_per_min_display = CostIndicator.render(cost_per_min)
 
+        if plan in P90_LIMIT_PLANS:
+            render_wide_bar = self._render_wide_progress_bar
             cost_limit_p90 = kwargs.get("cost_limit_p90", DEFAULT_COST_LIMIT)
             messages_limit_p90 = kwargs.get("messages_limit_p90", 1500)
 
-            screen_buffer.append("")
             if plan == "custom":
-                screen_buffer.append("[bold]📊 Session-Based Dynamic Limits[/bold]")
-                screen_buffer.append(
-                    "[dim]Based on your historical usage patterns when hitting limits (P90)[/dim]"
-                )
-                screen_buffer.append(f"[separator]{'─' * 60}[/]")
+                screen_buffer.extend(CUSTOM_LIMITS_HEADER)
             else:
-                screen_buffer.append("")
+                screen_buffer.extend(("", ""))
 
             cost_percentage = (
                 min(100, percentage(session_cost, cost_limit_p90))
                 if cost_limit_p90 > 0
                 else 0
             )
-            cost_bar = self._render_wide_progress_bar(cost_percentage)
-            screen_buffer.append(
-                f"💰 [value]Cost Usage:[/]           {cost_bar} {cost_percentage:4.1f}%    [value]${session_cost:.2f}[/] / [dim]${cost_limit_p90:.2f}[/]"
-            )
-            screen_buffer.append("")
-
-            token_bar = self._render_wide_progress_bar(usage_percentage)
-            screen_buffer.append(
-                f"📊 [value]Token Usage:[/]          {token_bar} {usage_percentage:4.1f}%    [value]{tokens_used:,}[/] / [dim]{token_limit:,}[/]"
+            cost_bar = render_wide_bar(cost_percentage)
+            token_bar = render_wide_bar(usage_percentage)
+            screen_buffer.extend(
+                (
+                    f"💰 [value]Cost Usage:[/]           {cost_bar} {cost_percentage:4.1f}%    [value]${session_cost:.2f}[/] / [dim]${cost_limit_p90:.2f}[/]",
+                    "",
+                    f"📊 [value]Token Usage:[/]          {token_bar} {usage_percentage:4.1f}%    [value]{tokens_used:,}[/] / [dim]{token_limit:,}[/]",
+                    "",
+                )
             )
-            screen_buffer.append("")
 
             messages_percentage = (
                 min(100, percentage(sent_messages, messages_limit_p90))
                 if messages_limit_p90 > 0
                 else 0
             )
-            messages_bar = self._render_wide_progress_bar(messages_percentage)
-            screen_buffer.append(
-                f"📨 [value]Messages Usage:[/]       {messages_bar} {messages_percentage:4.1f}%    [value]{sent_messages}[/] / [dim]{messages_limit_p90:,}[/]"
+            messages_bar = render_wide_bar(messages_percentage)
+            screen_buffer.extend(
+                (
+                    f"📨 [value]Messages Usage:[/]       {messages_bar} {messages_percentage:4.1f}%    [value]{sent_messages}[/] / [dim]{messages_limit_p90:,}[/]",
+                    SEPARATOR_LINE,
+                )
             )
-            screen_buffer.append(f"[separator]{'─' * 60}[/]")
 
             time_percentage = (
                 percentage(elapsed_session_minutes, total_session_minutes)
                 if total_session_minutes > 0
                 else 0
             )
-            time_bar = self._render_wide_progress_bar(time_percentage)
+            time_bar = render_wide_bar(time_percentage)
             time_remaining = max(0, total_session_minutes - elapsed_session_minutes)
             time_left_hours = int(time_remaining // 60)
             time_left_mins = int(time_remaining % 60)
-            screen_buffer.append(
-                f"⏱️  [value]Time to Reset:[/]       {time_bar} {time_left_hours}h {time_left_mins}m"
-            )
-            screen_buffer.append("")
-
-            if per_model_stats:
-                model_bar = self.model_usage.render(per_model_stats)
-                screen_buffer.append(f"🤖 [value]Model Distribution:[/]   {model_bar}")
-            else:
-                model_bar = self.model_usage.render({})
-                screen_buffer.append(f"🤖 [value]Model Distribution:[/]   {model_bar}")
-            screen_buffer.append(f"[separator]{'─' * 60}[/]")
-
-            velocity_emoji = VelocityIndicator.get_velocity_emoji(burn_rate)
-            screen_buffer.append(
-                f"🔥 [value]Burn Rate:[/]              [warning]{burn_rate:.1f}[/] [dim]tokens/min[/] {velocity_emoji}"
-            )
-
-            cost_per_min = (
-                session_cost / max(1, elapsed_session_minutes)
-                if elapsed_session_minutes > 0
-                else 0
-            )
-            cost_per_min_display = CostIndicator.render(cost_per_min)
-            screen_buffer.append(
-                f"💲 [value]Cost Rate:[/]              {cost_per_min_display} [dim]$/min[/]"
+            model_bar = self.model_usage.render(per_model_stats or {})
+            screen_buffer.extend(
+                (
+                    f"⏱️  [value]Time to Reset:[/]       {time_bar} {time_left_hours}h {time_left_mins}m",
+                    "",
+                    f"🤖 [value]Model Distribution:[/]   {model_bar}",
+                    SEPARATOR_LINE,
+                    f"🔥 [value]Burn Rate:[/]              [warning]{burn_rate:.1f}[/] [dim]tokens/min[/] {velocity_emoji}",
+                    f"💲 [value]Cost Rate:[/]              {cost_per_min_display} [dim]$/min[/]",
+                )
             )
         else:
             cost_display = CostIndicator.render(session_cost)
-            cost_per_min = (
-                session_cost / max(1, elapsed_session_minutes)
-                if elapsed_session_minutes > 0
-                else 0
-            )
-            cost_per_min_display = CostIndicator.render(cost_per_min)
-            screen_buffer.append(f"💲 [value]Session Cost:[/]   {cost_display}")
-            screen_buffer.append(
-                f"💲 [value]Cost Rate:[/]      {cost_per_min_display} [dim]$/min[/]"
-            )
-            screen_buffer.append("")
-
             token_bar = self.token_progress.render(usage_percentage)
-            screen_buffer.append(f"📊 [value]Token Usage:[/]    {token_bar}")
-            screen_buffer.append("")
-
-            screen_buffer.append(
-                f"🎯 [value]Tokens:[/]         [value]{tokens_used:,}[/] / [dim]~{token_limit:,}[/] ([info]{tokens_left:,} left[/])"
-            )
-
-            velocity_emoji = VelocityIndicator.get_velocity_emoji(burn_rate)
-            screen_buffer.append(
-                f"🔥 [value]Burn Rate:[/]      [warning]{burn_rate:.1f}[/] [dim]tokens/min[/] {velocity_emoji}"
-            )
-
-            screen_buffer.append(
-                f"📨 [value]Sent Messages:[/]  [info]{sent_messages}[/] [dim]messages[/]"
+            screen_buffer.extend(
+                (
+                    f"💲 [value]Session Cost:[/]   {cost_display}",
+                    f"💲 [value]Cost Rate:[/]      {cost_per_min_display} [dim]$/min[/]",
+                    "",
+                    f"📊 [value]Token Usage:[/]    {token_bar}",
+                    "",
+                    f"🎯 [value]Tokens:[/]         [value]{tokens_used:,}[/] / [dim]~{token_limit:,}[/] ([info]{tokens_left:,} left[/])",
+                    f"🔥 [value]Burn Rate:[/]      [warning]{burn_rate:.1f}[/] [dim]tokens/min[/] {velocity_emoji}",
+                    f"📨 [value]Sent Messages:[/]  [info]{sent_messages}[/] [dim]messages[/]",
+                )
             )
 
             if per_model_stats:
@@ -305,18 +298,17 @@ class SessionDisplayComponent:
             time_bar = self.time_progress.render(
                 elapsed_session_minutes, total_session_minutes
             )
-            screen_buffer.append(f"⏱️  [value]Time to Reset:[/]  {time_bar}")
-            screen_buffer.append("")
-
-        screen_buffer.append("")
-        screen_buffer.append("🔮 [value]Predictions:[/]")
-        screen_buffer.append(
-            f"   [info]Tokens will run out:[/] [warning]{predicted_end_str}[/]"
-        )
-        screen_buffer.append(
-            f"   [info]Limit resets at:[/]     [success]{reset_time_str}[/]"
+            screen_buffer.extend((f"⏱️  [value]Time to Reset:[/]  {time_bar}", ""))
+
+        screen_buffer.extend(
+            (
+                "",
+                "🔮 [value]Predictions:[/]",
+                f"   [info]Tokens will run out:[/] [warning]{predicted_end_str}[/]",
+                f"   [info]Limit resets at:[/]     [success]{reset_time_str}[/]",
+                "",
+            )
         )
-        screen_buffer.append("")
 
         self._add_notifications(
             screen_buffer,
@@ -355,21 +347,15 @@ class SessionDisplayComponent:
         notifications_added = False
 
         if show_switch_notification and token_limit > original_limit:
-            screen_buffer.append(
-                f"🔄 [warning]Token limit exceeded ({token_limit:,} tokens)[/]"
-            )
+            screen_buffer.append(_switch_notification(token_limit))
             notifications_added = True
 
         if show_exceed_notification:
-            screen_buffer.append(
-                "⚠️  [error]You have exceeded the maximum cost limit![/]"
-            )
+            screen_buffer.append(EXCEED_LIMIT_NOTIFICATION)
             notifications_added = True
 
         if show_tokens_will_run_out:
-            screen_buffer.append(
-                "⏰ [warning]Cost limit will be exceeded before reset![/]"
-            )
+            screen_buffer.append(COST_WILL_EXCEED_NOTIFICATION)
             notifications_added = True
 
         if notifications_added:
@@ -419,7 +405,7 @@ class SessionDisplayComponent:
 
         if current_time and args:
             try:
-                display_tz = pytz.timezone(args.timezone)
+                display_tz = get_display_timezone(args.timezone, fallback=None)
                 current_time_display = current_time.astimezone(display_tz)
                 current_time_str = format_display_time(
                     current_time_display,
@@ -3,7 +3,20 @@
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+NOTIFICATION_KEYS: Tuple[str, ...] = (
+    "switch_to_custom",
+    "exceed_max_limit",
+    "tokens_will_run_out",
+    "cost_will_exceed",
+)
+
+
+def _default_states() -> Dict[str, Dict[str, Union[bool, Optional[datetime]]]]:
+    """Build fresh, untriggered states for all known notifications."""
+    return {key: {"triggered": False, "timestamp": None} for key in NOTIFICATION_KEYS}
 
 
 class NotificationManager:
@@ -11,24 +24,17 @@ class NotificationManager:
 
     def __init__(self, config_dir: Path) -> None:
         self.notification_file: Path = config_dir / "notification_states.json"
+        self.default_states: Dict[str, Dict[str, Union[bool, Optional[datetime]]]] = (
+            _default_states()
+        )
         self.states: Dict[str, Dict[str, Union[bool, Optional[datetime]]]] = (
             self._load_states()
         )
 
-        self.default_states: Dict[str, Dict[str, Union[bool, Optional[datetime]]]] = {
-            "switch_to_custom": {"triggered": False, "timestamp": None},
-            "exceed_max_limit": {"triggered": False, "timestamp": None},
-            "tokens_will_run_out": {"triggered": False, "timestamp": None},
-        }
-
     def _load_states(self) -> Dict[str, Dict[str, Union[bool, Optional[datetime]]]]:
         """Load notification states from file."""
         if not self.notification_file.exists():
-            return {
-                "switch_to_custom": {"triggered": False, "timestamp": None},
-                "exceed_max_limit": {"triggered": False, "timestamp": None},
-                "tokens_will_run_out": {"triggered": False, "timestamp": None},
-            }
+            return _default_states()
 
         try:
             with open(self.notification_file) as f:
@@ -49,7 +55,7 @@ class NotificationManager:
                     parsed_states[key] = parsed_state
                 return parsed_states
         except (json.JSONDecodeError, FileNotFoundError, ValueError):
-            return self.default_states.copy()
+            return _default_states()
 
     def _save_states(self) -> None:
         """Save notification states to file."""
@@ -75,27 +81,30 @@ class NotificationManager:
                 f"Failed to save notification states to {self.notification_file}: {e}"
             )
 
-    def should_notify(self, key: str, cooldown_hours: Union[int, float] = 24) -> bool:
-        """Check if notification should be shown."""
-        if key not in self.states:
+    def should_notify(
+        self,
+        key: str,
+        cooldown_hours: Union[int, float] = 24,
+        current_time: Optional[datetime] = None,
+    ) -> bool:
+        """Check if notification should be shown.
+
+        Args:
+            key: Notification key
+            cooldown_hours: Hours to wait before showing the notification again
+            current_time: Local naive time to check against, defaults to now
+        """
+        state = self.states.get(key)
+        if state is None:
             self.states[key] = {"triggered": False, "timestamp": None}
             return True
 
-        state = self.states[key]
-        if not state["triggered"]:
-            return True
-
         timestamp_value = state["timestamp"]
-        if timestamp_value is None:
-            return True
-
-        if not isinstance(timestamp_value, datetime):
+        if not state["triggered"] or not isinstance(timestamp_value, datetime):
             return True
 
-        now: datetime = datetime.now()
-        time_since_last: timedelta = now - timestamp_value
-        cooldown_seconds: float = cooldown_hours * 3600
-        return time_since_last.total_seconds() >= cooldown_seconds
+        now: datetime = current_time or datetime.now()
+        return now - timestamp_value >= timedelta(hours=cooldown_hours)
 
     def mark_notified(self, key: str) -> None:
         """Mark notification as shown."""
@@ -115,7 +124,7 @@ class NotificationManager:
 
     def is_notification_active(self, key: str) -> bool:
         """Check if notification is currently active."""
-        state = self.get_notification_state(key)
-        triggered_value = state["triggered"]
-        timestamp_value = state["timestamp"]
-        return bool(triggered_value) and timestamp_value is not None
+        state = self.states.get(key)
+        if state is None:
+            return False
+        return bool(state["triggered"]) and state["timestamp"] is not None
@@ -8,6 +8,7 @@ import platform
 import re
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Union
 
 import pytz
@@ -123,6 +124,15 @@ except ImportError:
         return None
 
 
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+    parse_iso_datetime = None  # type: ignore[assignment]
+
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -365,6 +375,17 @@ class TimezoneHandler:
         if not timestamp_str:
             return None
 
+        if HAS_CISO8601:
+            try:
+                parsed: datetime = parse_iso_datetime(timestamp_str)
+                if parsed.tzinfo is None:
+                    return self.default_tz.localize(parsed)
+                if timestamp_str.endswith("Z"):
+                    return parsed.replace(tzinfo=pytz.UTC)
+                return parsed
+            except ValueError:
+                pass
+
         iso_tz_pattern: str = (
             r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:\d{2})?"
         )
@@ -458,6 +479,47 @@ class TimezoneHandler:
         return dt.strftime(fmt)
 
 
+_utc_handler: TimezoneHandler = TimezoneHandler()
+
+
+@lru_cache(maxsize=4096)
+def parse_utc_timestamp(timestamp_str: str) -> datetime:
+    """Parse a timestamp string into a UTC datetime, memoized across refreshes.
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed; failures are never cached
+    """
+    parsed = _utc_handler.parse_timestamp(timestamp_str)
+    if parsed is None:
+        raise ValueError(f"Unparsable timestamp: {timestamp_str!r}")
+    return _utc_handler.ensure_utc(parsed)
+
+
+@lru_cache(maxsize=16)
+def get_display_timezone(
+    tz_name: Optional[str], fallback: Optional[str] = "Europe/Warsaw"
+) -> BaseTzInfo:
+    """Resolve a display timezone by name, memoizing the pytz lookup.
+
+    Args:
+        tz_name: Timezone name to resolve
+        fallback: Timezone used when tz_name is unknown, or None to raise
+
+    Returns:
+        Resolved pytz timezone (the fallback result is cached as well)
+
+    Raises:
+        pytz.exceptions.UnknownTimeZoneError: If tz_name is unknown and no
+            fallback is given
+    """
+    try:
+        return pytz.timezone(tz_name)
+    except (pytz.exceptions.UnknownTimeZoneError, AttributeError):
+        if fallback is None:
+            raise
+        return pytz.timezone(fallback)
+
+
 def get_time_format_preference(args: Any = None) -> bool:
     """Get time format preference - returns True for 12h, False for 24h."""
     return TimeFormatDetector.get_preference(args)
@@ -510,6 +572,22 @@ def format_display_time(
     if use_12h_format is None:
         use_12h_format = get_time_format_preference()
 
+    # Truncate to the displayed precision so repeated ticks hit the cache;
+    # tzinfo is part of the key because aware datetimes compare by instant.
+    display_dt: datetime = dt_obj.replace(
+        second=dt_obj.second if include_seconds else 0, microsecond=0
+    )
+    return _format_clock(display_dt, dt_obj.tzinfo, use_12h_format, include_seconds)
+
+
+@lru_cache(maxsize=256)
+def _format_clock(
+    dt_obj: datetime,
+    tzinfo: Any,
+    use_12h_format: bool,
+    include_seconds: bool,
+) -> str:
+    """Format a wall-clock time, memoized per displayed value."""
     if use_12h_format:
         if include_seconds:
             try:
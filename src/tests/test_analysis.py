@@ -507,6 +507,8 @@ class TestBlockConversion:
         assert result["isGap"] is False
         assert result["totalTokens"] == 150
         assert result["entries_count"] == 1
+        assert result["startTimestamp"] == block.start_time.timestamp()
+        assert result["actualEndTimestamp"] == block.actual_end_time.timestamp()
 
     def test_add_optional_block_data_all_fields(self) -> None:
         """Test _add_optional_block_data with all optional fields."""
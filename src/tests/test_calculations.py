@@ -1,15 +1,16 @@
 """Tests for calculations module."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 from unittest.mock import Mock, patch
 
 import pytest
 
 from claude_monitor.core.calculations import (
     BurnRateCalculator,
+    _HourlyBurnRateCache,
+    _build_block_arrays,
     _calculate_total_tokens_in_hour,
-    _process_block_for_burn_rate,
     calculate_hourly_burn_rate,
 )
 from claude_monitor.core.models import BurnRate, TokenCounts, UsageProjection
@@ -153,6 +154,13 @@ class TestBurnRateCalculator:
 class TestHourlyBurnRateCalculation:
     """Test cases for hourly burn rate functions."""
 
+    @pytest.fixture(autouse=True)
+    def burn_rate_cache(self) -> Iterator[_HourlyBurnRateCache]:
+        """Give each test its own burn-rate cache."""
+        cache = _HourlyBurnRateCache()
+        with patch("claude_monitor.core.calculations._burn_rate_cache", cache):
+            yield cache
+
     @pytest.fixture
     def current_time(self) -> datetime:
         """Current time for testing."""
@@ -225,63 +233,177 @@ class TestHourlyBurnRateCalculation:
 
         assert burn_rate == 0.0
 
-    @patch("claude_monitor.core.calculations._process_block_for_burn_rate")
-    def test_calculate_total_tokens_in_hour(
-        self, mock_process_block: Mock, current_time: datetime
+    @patch("claude_monitor.core.calculations._calculate_total_tokens_in_hour")
+    def test_calculate_hourly_burn_rate_reused_within_minute(
+        self, mock_calc_tokens: Mock, current_time: datetime
     ) -> None:
+        """Test burn rate is computed once per minute for the same blocks."""
+        mock_calc_tokens.return_value = 120.0
+
+        blocks = [Mock()]
+        assert calculate_hourly_burn_rate(blocks, current_time) == 2.0
+        assert (
+            calculate_hourly_burn_rate(blocks, current_time + timedelta(seconds=3))
+            == 2.0
+        )
+        assert mock_calc_tokens.call_count == 1
+
+        calculate_hourly_burn_rate(blocks, current_time + timedelta(minutes=1))
+        calculate_hourly_burn_rate([Mock()], current_time + timedelta(minutes=1))
+        assert mock_calc_tokens.call_count == 3
+
+    def test_calculate_total_tokens_in_hour(self, current_time: datetime) -> None:
         """Test total tokens calculation for hour."""
-        # Mock returns different token counts for each block
-        mock_process_block.side_effect = [150.0, 0.0, 0.0]
+        blocks = [
+            {
+                "startTime": "2024-01-01T11:30:00Z",
+                "isActive": True,
+                "totalTokens": 300,
+            },
+            {
+                "startTime": "2024-01-01T10:00:00Z",
+                "actualEndTime": "2024-01-01T10:30:00Z",
+                "totalTokens": 1000,
+            },
+            {
+                "startTime": "2024-01-01T11:45:00Z",
+                "isGap": True,
+                "totalTokens": 500,
+            },
+            {
+                "startTime": "2024-01-01T10:30:00Z",
+                "actualEndTime": "2024-01-01T11:30:00Z",
+                "totalTokens": 600,
+            },
+        ]
+        one_hour_ago = current_time - timedelta(hours=1)
+
+        total_tokens = _calculate_total_tokens_in_hour(
+            blocks, one_hour_ago, current_time
+        )
 
-        blocks = [Mock(), Mock(), Mock()]
+        # Active block counts fully, the last block half, the others not at all
+        assert total_tokens == pytest.approx(600.0)
+
+    def test_calculate_total_tokens_in_hour_uses_epoch_fields(
+        self, current_time: datetime
+    ) -> None:
+        """Test precomputed epoch fields are used instead of ISO strings."""
+        now_ts = current_time.timestamp()
+        blocks = [
+            {
+                "startTime": "not-parsed",
+                "startTimestamp": now_ts - 3600,
+                "actualEndTimestamp": now_ts - 1800,
+                "totalTokens": 400,
+            },
+            {
+                "startTime": "not-parsed",
+                "startTimestamp": now_ts - 600,
+                "isActive": True,
+                "totalTokens": 100,
+            },
+        ]
+        one_hour_ago = current_time - timedelta(hours=1)
+
+        with patch(
+            "claude_monitor.core.calculations._parse_block_start_time"
+        ) as mock_parse:
+            total_tokens = _calculate_total_tokens_in_hour(
+                blocks, one_hour_ago, current_time
+            )
+
+        mock_parse.assert_not_called()
+        assert total_tokens == pytest.approx(500.0)
+
+    def test_block_arrays_built_once_per_block_list(
+        self, current_time: datetime
+    ) -> None:
+        """Test block arrays are reused for the same list and sorted by end."""
+        blocks = [
+            {"startTime": "2024-01-01T11:30:00Z", "isActive": True, "totalTokens": 1},
+            {
+                "startTime": "2024-01-01T05:00:00Z",
+                "actualEndTime": "2024-01-01T06:00:00Z",
+                "totalTokens": 2,
+            },
+        ]
+        one_hour_ago = current_time - timedelta(hours=1)
+
+        with patch(
+            "claude_monitor.core.calculations._build_block_arrays",
+            wraps=_build_block_arrays,
+        ) as mock_build:
+            _calculate_total_tokens_in_hour(blocks, one_hour_ago, current_time)
+            _calculate_total_tokens_in_hour(blocks, one_hour_ago, current_time)
+            _calculate_total_tokens_in_hour(list(blocks), one_hour_ago, current_time)
+
+        assert mock_build.call_count == 2
+
+        _, ends, totals = _build_block_arrays(blocks)
+        assert list(totals) == [2.0, 1.0]
+        assert ends[-1] == float("inf")
+
+    def test_calculate_total_tokens_in_hour_skips_blocks_before_hour(
+        self, current_time: datetime
+    ) -> None:
+        """Test only blocks overlapping the last hour contribute tokens."""
+        blocks = [
+            {
+                "startTime": f"2024-01-01T{hour:02d}:15:00Z",
+                "actualEndTime": f"2024-01-01T{hour:02d}:50:00Z",
+                "totalTokens": 100 * hour,
+            }
+            for hour in range(8, 12)
+        ]
         one_hour_ago = current_time - timedelta(hours=1)
 
         total_tokens = _calculate_total_tokens_in_hour(
             blocks, one_hour_ago, current_time
         )
 
-        assert total_tokens == 150.0
-        assert mock_process_block.call_count == 3
+        assert total_tokens == pytest.approx(1100.0)
 
-    def test_process_block_for_burn_rate_gap_block(
+    def test_calculate_total_tokens_in_hour_gap_block(
         self, current_time: datetime
     ) -> None:
-        """Test processing gap block returns zero."""
-        gap_block = {"isGap": True, "start_time": "2024-01-01T11:30:00Z"}
+        """Test gap blocks contribute no tokens."""
+        gap_block = {
+            "isGap": True,
+            "startTime": "2024-01-01T11:30:00Z",
+            "totalTokens": 500,
+        }
         one_hour_ago = current_time - timedelta(hours=1)
 
-        tokens = _process_block_for_burn_rate(gap_block, one_hour_ago, current_time)
+        tokens = _calculate_total_tokens_in_hour(
+            [gap_block], one_hour_ago, current_time
+        )
         assert tokens == 0
 
     @patch("claude_monitor.core.calculations._parse_block_start_time")
-    def test_process_block_for_burn_rate_invalid_start_time(
+    def test_calculate_total_tokens_in_hour_invalid_start_time(
         self, mock_parse_time: Mock, current_time: datetime
     ) -> None:
-        """Test processing block with invalid start time returns zero."""
+        """Test blocks with an unparsable start time contribute no tokens."""
         mock_parse_time.return_value = None
 
-        block = {"isGap": False, "start_time": "invalid"}
+        block = {"startTime": "invalid", "isActive": True, "totalTokens": 500}
         one_hour_ago = current_time - timedelta(hours=1)
 
-        tokens = _process_block_for_burn_rate(block, one_hour_ago, current_time)
+        tokens = _calculate_total_tokens_in_hour([block], one_hour_ago, current_time)
         assert tokens == 0
 
-    @patch("claude_monitor.core.calculations._determine_session_end_time")
-    @patch("claude_monitor.core.calculations._parse_block_start_time")
-    def test_process_block_for_burn_rate_old_session(
-        self, mock_parse_time: Mock, mock_end_time: Mock, current_time: datetime
+    def test_calculate_hourly_burn_rate_old_session(
+        self, current_time: datetime
     ) -> None:
-        """Test processing block that ended before the hour window."""
-        one_hour_ago = current_time - timedelta(hours=1)
-        old_time = one_hour_ago - timedelta(minutes=30)
-
-        mock_parse_time.return_value = old_time
-        mock_end_time.return_value = old_time  # Session ended before one hour ago
-
-        block = {"isGap": False, "start_time": "2024-01-01T10:30:00Z"}
+        """Test sessions that ended before the hour window are ignored."""
+        block = {
+            "startTime": "2024-01-01T10:00:00Z",
+            "actualEndTime": "2024-01-01T10:30:00Z",
+            "totalTokens": 1000,
+        }
 
-        tokens = _process_block_for_burn_rate(block, one_hour_ago, current_time)
-        assert tokens == 0
+        assert calculate_hourly_burn_rate([block], current_time) == 0.0
 
 
 class TestCalculationEdgeCases:
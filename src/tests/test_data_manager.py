@@ -0,0 +1,67 @@
+"""Tests for DataManager caching."""
+
+import time
+from unittest.mock import Mock, patch
+
+from claude_monitor.monitoring.data_manager import DataManager
+
+
+class TestDataManager:
+    """Test cases for DataManager caching."""
+
+    def test_cache_age_ignores_wall_clock_changes(self) -> None:
+        """Test cache validity is measured on the monotonic clock."""
+        manager = DataManager(cache_ttl=30)
+        manager._set_cache({"blocks": []})
+
+        with patch("time.time", return_value=time.time() + 3600):
+            assert manager._is_cache_valid() is True
+            assert manager.cache_age < 30
+
+    def test_cache_expires_at_deadline(self) -> None:
+        """Test cached data expires once its precomputed deadline passes."""
+        manager = DataManager(cache_ttl=30)
+        manager._set_cache({"blocks": []})
+        deadline = manager._cache_expires_at
+
+        with patch("time.monotonic", return_value=deadline):
+            assert manager._is_cache_valid() is True
+        with patch("time.monotonic", return_value=deadline + 0.1):
+            assert manager._is_cache_valid() is False
+
+        manager.invalidate_cache()
+        assert manager._is_cache_valid() is False
+
+    @patch("claude_monitor.monitoring.data_manager.analyze_usage")
+    @patch("claude_monitor.monitoring.data_manager.get_data_signature")
+    def test_unchanged_files_reuse_expired_cache(
+        self, mock_signature: Mock, mock_analyze: Mock
+    ) -> None:
+        """Test an expired cache is reused while the data files are unchanged."""
+        mock_signature.return_value = (1, 100.0, 10)
+        mock_analyze.return_value = {"blocks": []}
+        manager = DataManager(cache_ttl=5, unchanged_cache_ttl=60)
+
+        first = manager.get_data()
+        manager._cache_expires_at = 0.0  # Simulate cache_ttl elapsing
+        second = manager.get_data()
+
+        assert second is first
+        mock_analyze.assert_called_once()
+
+    @patch("claude_monitor.monitoring.data_manager.analyze_usage")
+    @patch("claude_monitor.monitoring.data_manager.get_data_signature")
+    def test_changed_files_refetch(
+        self, mock_signature: Mock, mock_analyze: Mock
+    ) -> None:
+        """Test a new data file signature forces a fresh fetch."""
+        mock_signature.side_effect = [(1, 100.0, 10), (1, 101.0, 20)]
+        mock_analyze.side_effect = [{"blocks": []}, {"blocks": [{"id": "new"}]}]
+        manager = DataManager(cache_ttl=5, unchanged_cache_ttl=60)
+
+        manager.get_data()
+        manager._cache_expires_at = 0.0  # Simulate cache_ttl elapsing
+        second = manager.get_data()
+
+        assert second == {"blocks": [{"id": "new"}]}
+        assert mock_analyze.call_count == 2
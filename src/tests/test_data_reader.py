@@ -23,6 +23,7 @@ from claude_monitor.data.reader import (
     _process_single_file,
     _should_process_entry,
     _update_processed_hashes,
+    get_data_signature,
     load_all_raw_entries,
     load_usage_entries,
 )
@@ -263,6 +264,34 @@ class TestFindJsonlFiles:
             assert len(result) == 3
 
 
+class TestGetDataSignature:
+    """Test the get_data_signature function."""
+
+    def test_get_data_signature_nonexistent_path(self) -> None:
+        """Test a missing data directory yields an empty signature."""
+        with patch("claude_monitor.data.reader.logger"):
+            result = get_data_signature("/nonexistent/path")
+
+        assert result == (0, 0.0, 0)
+
+    def test_get_data_signature_changes_with_content(self) -> None:
+        """Test the signature counts only JSONL files and tracks appends."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            data_file = temp_path / "file1.jsonl"
+            data_file.write_text('{"a": 1}\n')
+            (temp_path / "notes.txt").write_text("ignored")
+
+            first = get_data_signature(temp_dir)
+            assert first[0] == 1
+            assert first[2] == data_file.stat().st_size
+
+            with open(data_file, "a") as f:
+                f.write('{"b": 2}\n')
+
+            assert get_data_signature(temp_dir) != first
+
+
 class TestProcessSingleFile:
     """Test the _process_single_file function."""
 
@@ -12,6 +12,7 @@ from claude_monitor.ui.display_controller import (
     ScreenBufferManager,
     SessionCalculator,
 )
+from claude_monitor.utils.time_utils import parse_utc_timestamp
 
 
 class TestDisplayController:
@@ -182,7 +183,7 @@ class TestDisplayController:
             ) as mock_active,
         ):
             # Configure should_notify to return True only for switch_to_custom
-            def should_notify_side_effect(notification_type):
+            def should_notify_side_effect(notification_type, current_time=None):
                 return notification_type == "switch_to_custom"
 
             mock_should.side_effect = should_notify_side_effect
@@ -195,6 +196,7 @@ class TestDisplayController:
                 cost_limit=5.0,
                 predicted_end_time=datetime.now(timezone.utc) + timedelta(hours=2),
                 reset_time=datetime.now(timezone.utc) + timedelta(hours=12),
+                current_time=datetime.now(timezone.utc),
             )
 
             assert result["show_switch_notification"] is True
@@ -216,7 +218,7 @@ class TestDisplayController:
             ) as mock_active,
         ):
             # Configure should_notify to return True only for exceed_max_limit
-            def should_notify_side_effect(notification_type):
+            def should_notify_side_effect(notification_type, current_time=None):
                 return notification_type == "exceed_max_limit"
 
             mock_should.side_effect = should_notify_side_effect
@@ -229,6 +231,7 @@ class TestDisplayController:
                 cost_limit=5.0,
                 predicted_end_time=datetime.now(timezone.utc) + timedelta(hours=2),
                 reset_time=datetime.now(timezone.utc) + timedelta(hours=12),
+                current_time=datetime.now(timezone.utc),
             )
 
             assert result["show_exceed_notification"] is True
@@ -249,8 +252,9 @@ class TestDisplayController:
             mock_should.return_value = True
 
             # Predicted end time before reset time
-            predicted_end = datetime.now(timezone.utc) + timedelta(hours=1)
-            reset_time = datetime.now(timezone.utc) + timedelta(hours=12)
+            current_time = datetime.now(timezone.utc)
+            predicted_end = current_time + timedelta(hours=1)
+            reset_time = current_time + timedelta(hours=12)
 
             result = controller._check_notifications(
                 token_limit=200000,
@@ -259,28 +263,29 @@ class TestDisplayController:
                 cost_limit=5.0,
                 predicted_end_time=predicted_end,
                 reset_time=reset_time,
+                current_time=current_time,
             )
 
             assert result["show_cost_will_exceed"] is True
-            mock_should.assert_called_with("cost_will_exceed")
+            mock_should.assert_called_with(
+                "cost_will_exceed",
+                current_time=current_time.astimezone().replace(tzinfo=None),
+            )
             mock_mark.assert_called_with("cost_will_exceed")
 
-    @patch("claude_monitor.ui.display_controller.TimezoneHandler")
+    @patch("claude_monitor.ui.display_controller.get_display_timezone")
     @patch("claude_monitor.ui.display_controller.get_time_format_preference")
     @patch("claude_monitor.ui.display_controller.format_display_time")
     def test_format_display_times(
         self,
         mock_format_time,
         mock_get_format,
-        mock_tz_handler_class,
+        mock_get_tz,
         controller,
         sample_args,
     ):
         """Test display time formatting."""
-        mock_tz_handler = Mock()
-        mock_tz_handler.validate_timezone.return_value = True
-        mock_tz_handler.convert_to_timezone.return_value = datetime.now(timezone.utc)
-        mock_tz_handler_class.return_value = mock_tz_handler
+        mock_get_tz.return_value = timezone.utc
 
         mock_get_format.return_value = "24h"
         mock_format_time.return_value = "12:00:00"
@@ -296,6 +301,7 @@ class TestDisplayController:
         assert "predicted_end_str" in result
         assert "reset_time_str" in result
         assert "current_time_str" in result
+        mock_get_tz.assert_called_once_with(sample_args.timezone)
 
     def test_calculate_model_distribution_empty_stats(self, controller):
         """Test model distribution calculation with empty stats."""
@@ -507,8 +513,8 @@ class TestScreenBufferManager:
         result = manager.create_screen_renderable(screen_buffer)
 
         assert result is mock_group_obj
-        assert mock_text.from_markup.call_count == 3
-        mock_group.assert_called_once()
+        mock_text.from_markup.assert_called_once_with("Line 1\nLine 2\nLine 3")
+        mock_group.assert_called_once_with(mock_text_obj)
 
     @patch("claude_monitor.terminal.themes.get_themed_console")
     @patch("claude_monitor.ui.display_controller.Group")
@@ -528,6 +534,9 @@ class TestScreenBufferManager:
 
         assert result is mock_group_obj
         mock_group.assert_called_once()
+        args = mock_group.call_args[0]
+        assert len(args) == 2
+        assert args[1] is mock_object
 
 
 class TestDisplayControllerEdgeCases:
@@ -684,6 +693,26 @@ class TestDisplayControllerAdvanced:
                     data["blocks"]
                 )
 
+    @patch("claude_monitor.ui.display_controller.AdvancedCustomLimitDisplay")
+    def test_custom_p90_limits_computed_once_per_block_list(
+        self, mock_advanced_display, controller
+    ):
+        """Test custom P90 limits are reused until a new block list arrives."""
+        mock_temp_display = mock_advanced_display.return_value
+        mock_temp_display._collect_session_data.return_value = {"limit_sessions": []}
+        mock_temp_display._calculate_session_percentiles.return_value = {
+            "costs": {"p90": 5.0},
+            "messages": {"p90": 100},
+        }
+        blocks = [{"isActive": True, "totalTokens": 100}]
+
+        assert controller._get_custom_p90_limits(blocks) == (5.0, 100)
+        assert controller._get_custom_p90_limits(blocks) == (5.0, 100)
+        mock_temp_display._collect_session_data.assert_called_once_with(blocks)
+
+        controller._get_custom_p90_limits(list(blocks))
+        assert mock_temp_display._collect_session_data.call_count == 2
+
     def test_create_data_display_exception_handling(self, controller):
         """Test create_data_display exception handling."""
         args = Mock()
@@ -850,10 +879,6 @@ class TestSessionCalculator:
         """Create a SessionCalculator instance."""
         return SessionCalculator()
 
-    def test_init(self, calculator):
-        """Test SessionCalculator initialization."""
-        assert calculator.tz_handler is not None
-
     def test_calculate_time_data_with_start_end(self, calculator):
         """Test calculate_time_data with start and end times."""
         session_data = {
@@ -862,39 +887,43 @@ class TestSessionCalculator:
         }
         current_time = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
 
-        with patch.object(calculator.tz_handler, "parse_timestamp") as mock_parse:
-            with patch.object(calculator.tz_handler, "ensure_utc") as mock_ensure:
-                start_time = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
-                end_time = datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+        result = calculator.calculate_time_data(session_data, current_time)
 
-                mock_parse.side_effect = [start_time, end_time]
-                mock_ensure.side_effect = [start_time, end_time]
+        assert result["start_time"] == datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+        assert result["reset_time"] == datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+        assert result["total_session_minutes"] == 120  # 2 hours
+        assert result["elapsed_session_minutes"] == 90  # 1.5 hours
 
-                result = calculator.calculate_time_data(session_data, current_time)
+    def test_calculate_time_data_reuses_parsed_times(self, calculator):
+        """Test session timestamps are parsed once across refreshes."""
+        session_data = {
+            "start_time_str": "2024-01-01T11:00:00Z",
+            "end_time_str": "2024-01-01T16:00:00Z",
+        }
+        current_time = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        parse_utc_timestamp.cache_clear()
+
+        first = calculator.calculate_time_data(session_data, current_time)
+        second = calculator.calculate_time_data(
+            session_data, current_time + timedelta(seconds=10)
+        )
 
-                assert result["start_time"] == start_time
-                assert result["reset_time"] == end_time
-                assert result["total_session_minutes"] == 120  # 2 hours
-                assert result["elapsed_session_minutes"] == 90  # 1.5 hours
+        assert parse_utc_timestamp.cache_info().misses == 2
+        assert second["start_time"] == first["start_time"]
+        assert second["reset_time"] == datetime(2024, 1, 1, 16, tzinfo=timezone.utc)
 
     def test_calculate_time_data_no_end_time(self, calculator):
         """Test calculate_time_data without end time."""
         session_data = {"start_time_str": "2024-01-01T11:00:00Z"}
         current_time = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        start_time = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
 
-        with patch.object(calculator.tz_handler, "parse_timestamp") as mock_parse:
-            with patch.object(calculator.tz_handler, "ensure_utc") as mock_ensure:
-                start_time = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
-
-                mock_parse.return_value = start_time
-                mock_ensure.return_value = start_time
-
-                result = calculator.calculate_time_data(session_data, current_time)
+        result = calculator.calculate_time_data(session_data, current_time)
 
-                assert result["start_time"] == start_time
-                # Reset time should be start_time + 5 hours
-                expected_reset = start_time + timedelta(hours=5)
-                assert result["reset_time"] == expected_reset
+        assert result["start_time"] == start_time
+        # Reset time should be start_time + 5 hours
+        expected_reset = start_time + timedelta(hours=5)
+        assert result["reset_time"] == expected_reset
 
     def test_calculate_time_data_no_start_time(self, calculator):
         """Test calculate_time_data without start time."""
@@ -930,6 +959,20 @@ class TestSessionCalculator:
             assert result["cost_remaining"] == 7.5
             assert "predicted_end_time" in result
 
+    def test_calculate_cost_predictions_uses_tick_time(self, calculator):
+        """Test cost predictions reuse the time captured for the tick."""
+        current_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        session_data = {"session_cost": 2.5}
+        time_data = {"elapsed_session_minutes": 60, "current_time": current_time}
+
+        with patch("claude_monitor.ui.display_controller.datetime") as mock_datetime:
+            result = calculator.calculate_cost_predictions(
+                session_data, time_data, 10.0
+            )
+
+        mock_datetime.now.assert_not_called()
+        assert result["predicted_end_time"] == current_time + timedelta(minutes=180)
+
     def test_calculate_cost_predictions_no_cost_limit(self, calculator):
         """Test calculate_cost_predictions without cost limit."""
         session_data = {"session_cost": 1.0}
@@ -456,6 +456,47 @@ class TestMonitoringOrchestratorFetchAndProcess:
         assert orchestrator._first_data_event.is_set()
 
 
+class TestMonitoringOrchestratorPollingInterval:
+    """Test adaptive polling interval."""
+
+    def test_next_interval_backs_off_while_idle(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test polling interval grows without an active session."""
+        orchestrator.update_interval = 2
+        orchestrator.session_monitor.current_session_id = None
+
+        intervals = [orchestrator._next_interval() for _ in range(5)]
+
+        assert intervals == [2, 4, 8, 10.0, 10.0]
+
+    def test_next_interval_idle_never_below_update_interval(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test a refresh rate above the idle cap is kept while idle."""
+        orchestrator.update_interval = 15
+        orchestrator.session_monitor.current_session_id = None
+
+        intervals = [orchestrator._next_interval() for _ in range(3)]
+
+        assert intervals == [15, 15, 15]
+
+    def test_next_interval_resets_on_active_session(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test polling interval returns to base once a session is active."""
+        orchestrator.update_interval = 5
+        orchestrator.session_monitor.current_session_id = None
+        assert orchestrator._next_interval() == 5
+        assert orchestrator._next_interval() == 10
+
+        orchestrator.session_monitor.current_session_id = "session_1"
+        assert orchestrator._next_interval() == 5
+
+        orchestrator.session_monitor.current_session_id = None
+        assert orchestrator._next_interval() == 5
+
+
 class TestMonitoringOrchestratorTokenLimitCalculation:
     """Test token limit calculation logic."""
 
@@ -511,6 +552,27 @@ class TestMonitoringOrchestratorTokenLimitCalculation:
         assert result == 175000
         mock_get_limit.assert_called_once_with("custom", blocks_data)
 
+    def test_calculate_token_limit_custom_plan_reuses_result(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test custom limit is only recalculated when blocks change."""
+        args = Mock()
+        args.plan = "custom"
+        orchestrator.set_args(args)
+
+        data: Dict[str, List[Dict[str, int]]] = {"blocks": [{"totalTokens": 1000}]}
+
+        with patch(
+            "claude_monitor.monitoring.orchestrator.get_token_limit",
+            return_value=175000,
+        ) as mock_get_limit:
+            assert orchestrator._calculate_token_limit(data) == 175000
+            assert orchestrator._calculate_token_limit(data) == 175000
+            assert mock_get_limit.call_count == 1
+
+            orchestrator._calculate_token_limit({"blocks": [{"totalTokens": 5}]})
+            assert mock_get_limit.call_count == 2
+
     def test_calculate_token_limit_exception(
         self, orchestrator: MonitoringOrchestrator
     ) -> None:
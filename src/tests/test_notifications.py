@@ -0,0 +1,90 @@
+"""Tests for notification management."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from claude_monitor.utils.notifications import NOTIFICATION_KEYS, NotificationManager
+
+
+class TestNotificationManager:
+    """Test cases for NotificationManager."""
+
+    def test_init_without_state_file(self, tmp_path: Path) -> None:
+        """Test all known notifications start untriggered."""
+        manager = NotificationManager(tmp_path)
+
+        assert set(manager.states) == set(NOTIFICATION_KEYS)
+        assert not any(manager.is_notification_active(k) for k in NOTIFICATION_KEYS)
+
+    def test_init_with_corrupt_state_file(self, tmp_path: Path) -> None:
+        """Test a corrupt state file falls back to default states."""
+        (tmp_path / "notification_states.json").write_text("{not json")
+
+        manager = NotificationManager(tmp_path)
+
+        assert set(manager.states) == set(NOTIFICATION_KEYS)
+
+    def test_mark_notified_round_trip(self, tmp_path: Path) -> None:
+        """Test marked notifications are active, persisted and cooled down."""
+        manager = NotificationManager(tmp_path)
+        assert manager.should_notify("switch_to_custom") is True
+
+        manager.mark_notified("switch_to_custom")
+
+        assert manager.is_notification_active("switch_to_custom") is True
+        assert manager.should_notify("switch_to_custom") is False
+
+        reloaded = NotificationManager(tmp_path)
+        assert reloaded.is_notification_active("switch_to_custom") is True
+
+    def test_should_notify_after_cooldown(self, tmp_path: Path) -> None:
+        """Test notifications fire again once the cooldown has passed."""
+        manager = NotificationManager(tmp_path)
+        manager.states["exceed_max_limit"] = {
+            "triggered": True,
+            "timestamp": datetime.now() - timedelta(hours=2),
+        }
+
+        assert manager.should_notify("exceed_max_limit", cooldown_hours=1) is True
+        assert manager.should_notify("exceed_max_limit", cooldown_hours=3) is False
+
+    def test_should_notify_with_explicit_time(self, tmp_path: Path) -> None:
+        """Test the cooldown is checked against a caller-supplied time."""
+        manager = NotificationManager(tmp_path)
+        marked_at = datetime(2024, 1, 1, 12, 0, 0)
+        manager.states["exceed_max_limit"] = {
+            "triggered": True,
+            "timestamp": marked_at,
+        }
+
+        assert (
+            manager.should_notify(
+                "exceed_max_limit",
+                cooldown_hours=1,
+                current_time=marked_at + timedelta(minutes=59),
+            )
+            is False
+        )
+        assert (
+            manager.should_notify(
+                "exceed_max_limit",
+                cooldown_hours=1,
+                current_time=marked_at + timedelta(hours=1),
+            )
+            is True
+        )
+
+    def test_unknown_key(self, tmp_path: Path) -> None:
+        """Test unknown notifications are inactive and registered on check."""
+        manager = NotificationManager(tmp_path)
+
+        assert manager.is_notification_active("made_up_key") is False
+        assert manager.should_notify("made_up_key") is True
+        assert "made_up_key" in manager.states
+
+    def test_default_states_cover_controller_keys(self, tmp_path: Path) -> None:
+        """Test every key the display controller checks has a default state."""
+        manager = NotificationManager(tmp_path)
+
+        for key in ("switch_to_custom", "exceed_max_limit", "cost_will_exceed"):
+            assert manager.states[key] == {"triggered": False, "timestamp": None}
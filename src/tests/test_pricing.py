@@ -325,6 +325,23 @@ class TestPricingCalculator:
         expected = (1000000 * 15.0 + 500000 * 75.0) / 1000000
         assert abs(cost - expected) < 1e-6
 
+    def test_cost_cache_evicts_least_recently_used(
+        self, calculator: PricingCalculator
+    ) -> None:
+        """Test that the cost cache stays bounded and keeps recent entries."""
+        calculator.MAX_COST_CACHE_SIZE = 2
+
+        calculator.calculate_cost(model="claude-3-haiku", input_tokens=1)
+        calculator.calculate_cost(model="claude-3-haiku", input_tokens=2)
+        calculator.calculate_cost(model="claude-3-haiku", input_tokens=1)
+        calculator.calculate_cost(model="claude-3-haiku", input_tokens=3)
+
+        assert len(calculator._cost_cache) == 2
+        assert list(calculator._cost_cache) == [
+            ("claude-3-haiku", 1, 0, 0, 0),
+            ("claude-3-haiku", 3, 0, 0, 0),
+        ]
+
     def test_all_supported_models(self, calculator: PricingCalculator) -> None:
         """Test that all supported models can calculate costs."""
         supported_models: List[str] = [
@@ -0,0 +1,42 @@
+"""Tests for progress bar components."""
+
+import pytest
+
+from claude_monitor.ui.progress_bars import TokenProgressBar, _bar_segments
+
+
+class TestTokenProgressBar:
+    """Test cases for TokenProgressBar."""
+
+    @pytest.mark.parametrize(
+        ("percentage", "filled_style", "empty_style", "icon"),
+        [
+            (0.0, "cost.low", "table.border", "🟢"),
+            (50.0, "cost.medium", "table.border", "🟡"),
+            (90.0, "cost.high", "cost.medium", "🔴"),
+            (100.0, "cost.high", "cost.medium", "🔴"),
+        ],
+    )
+    def test_render_matches_threshold_mapping(
+        self, percentage: float, filled_style: str, empty_style: str, icon: str
+    ) -> None:
+        """Test tiered rendering keeps the threshold/colour mapping."""
+        bar = TokenProgressBar(width=20)
+        filled = int(20 * percentage / 100)
+        expected_bar = (
+            f"[{filled_style}]{'█' * filled}[/]"
+            f"[{empty_style}]{'░' * (20 - filled)}[/]"
+        )
+
+        assert bar.render(percentage) == f"{icon} [{expected_bar}] {percentage:.1f}%"
+
+    def test_bar_segments_cached(self) -> None:
+        """Test segment strings are built once per fill level."""
+        _bar_segments.cache_clear()
+
+        first = _bar_segments(5, 20, "█", "░")
+        second = _bar_segments(5, 20, "█", "░")
+
+        assert first == ("█" * 5, "░" * 15)
+        assert first is second
+        assert _bar_segments.cache_info().hits == 1
@@ -0,0 +1,60 @@
+"""Tests for session display components."""
+
+from typing import Any, Dict
+
+from claude_monitor.ui.session_display import SessionDisplayComponent
+
+
+class TestSessionDisplayComponent:
+    """Test cases for SessionDisplayComponent."""
+
+    @staticmethod
+    def _screen_args(**overrides: Any) -> Dict[str, Any]:
+        args: Dict[str, Any] = {
+            "plan": "pro",
+            "timezone": "UTC",
+            "tokens_used": 1000,
+            "token_limit": 19000,
+            "usage_percentage": 5.3,
+            "tokens_left": 18000,
+            "elapsed_session_minutes": 30.0,
+            "total_session_minutes": 300.0,
+            "burn_rate": 33.3,
+            "session_cost": 0.5,
+            "per_model_stats": {"claude-sonnet": {"input_tokens": 10}},
+            "sent_messages": 3,
+            "entries": [],
+            "predicted_end_str": "15:00",
+            "reset_time_str": "17:00",
+            "current_time_str": "12:00:00",
+        }
+        args.update(overrides)
+        return args
+
+    def test_active_screen_ends_with_current_time(self) -> None:
+        """Test every refresh renders the current clock on the last line."""
+        component = SessionDisplayComponent()
+
+        first = component.format_active_session_screen(**self._screen_args())
+        second = component.format_active_session_screen(
+            **self._screen_args(current_time_str="12:00:01")
+        )
+
+        assert "12:00:00" in first[-1]
+        assert "12:00:01" in second[-1]
+        assert first[:-1] == second[:-1]
+
+    def test_custom_plan_shows_p90_limits(self) -> None:
+        """Test the custom plan renders the P90 cost and message limits."""
+        component = SessionDisplayComponent()
+
+        screen = component.format_active_session_screen(
+            **self._screen_args(
+                plan="custom", cost_limit_p90=25.0, messages_limit_p90=500
+            )
+        )
+        text = "\n".join(screen)
+
+        assert "$25.00" in text
+        assert "500" in text
+        assert "Model Distribution" in text
@@ -15,9 +15,11 @@ from claude_monitor.utils.time_utils import (
     TimezoneHandler,
     format_display_time,
     format_time,
+    get_display_timezone,
     get_system_time_format,
     get_system_timezone,
     get_time_format_preference,
+    parse_utc_timestamp,
     percentage,
 )
 
@@ -454,6 +456,33 @@ class TestTimezoneHandler:
         assert result is not None
         assert result.tzinfo.zone == "America/New_York"
 
+    @patch("claude_monitor.utils.time_utils.HAS_CISO8601", True)
+    @patch("claude_monitor.utils.time_utils.parse_iso_datetime")
+    def test_parse_timestamp_with_ciso8601(self, mock_parse: Mock) -> None:
+        """Test the ciso8601 fast path normalizes Z suffixes to pytz.UTC."""
+        mock_parse.return_value = datetime(
+            2024, 1, 1, 12, 0, tzinfo=pytz.FixedOffset(0)
+        )
+        handler = TimezoneHandler()
+        result = handler.parse_timestamp("2024-01-01T12:00:00Z")
+
+        mock_parse.assert_called_once_with("2024-01-01T12:00:00Z")
+        assert result == datetime(2024, 1, 1, 12, 0, tzinfo=pytz.UTC)
+        assert result.tzinfo == pytz.UTC
+
+    @patch("claude_monitor.utils.time_utils.HAS_CISO8601", True)
+    @patch(
+        "claude_monitor.utils.time_utils.parse_iso_datetime",
+        side_effect=ValueError("bad"),
+    )
+    def test_parse_timestamp_ciso8601_falls_back(self, mock_parse: Mock) -> None:
+        """Test formats ciso8601 rejects still go through the regular parsers."""
+        handler = TimezoneHandler("UTC")
+        result = handler.parse_timestamp("2024/01/01 12:00:00")
+
+        assert result is not None
+        assert result.hour == 12
+
     def test_parse_timestamp_invalid_iso(self) -> None:
         """Test parsing invalid ISO timestamp."""
         handler = TimezoneHandler()
@@ -644,6 +673,41 @@ class TestPublicAPI:
             assert result == "24h"
             mock_get.assert_called_once()
 
+    def test_get_display_timezone_cached(self) -> None:
+        """Test get_display_timezone memoizes resolved timezones."""
+        get_display_timezone.cache_clear()
+
+        first = get_display_timezone("America/New_York")
+        second = get_display_timezone("America/New_York")
+
+        assert first is second
+        assert first.zone == "America/New_York"
+        assert get_display_timezone.cache_info().hits == 1
+
+    def test_parse_utc_timestamp_is_memoized(self) -> None:
+        """Test repeated timestamps are parsed once and returned in UTC."""
+        parse_utc_timestamp.cache_clear()
+
+        first = parse_utc_timestamp("2024-01-01T11:30:00+02:00")
+        second = parse_utc_timestamp("2024-01-01T11:30:00+02:00")
+
+        assert first is second
+        assert first == datetime(2024, 1, 1, 9, 30, tzinfo=pytz.UTC)
+        assert parse_utc_timestamp.cache_info().hits == 1
+
+    def test_parse_utc_timestamp_invalid_raises(self) -> None:
+        """Test unparsable timestamps raise instead of being cached."""
+        with pytest.raises(ValueError, match="Unparsable timestamp"):
+            parse_utc_timestamp("invalid")
+
+    def test_get_display_timezone_fallback(self) -> None:
+        """Test get_display_timezone falls back for unknown names."""
+        result = get_display_timezone("Invalid/Timezone")
+        assert result.zone == "Europe/Warsaw"
+
+        with pytest.raises(pytz.exceptions.UnknownTimeZoneError):
+            get_display_timezone("Invalid/Timezone", fallback=None)
+
 
 class TestFormattingUtilities:
     """Test cases for formatting utility functions."""
@@ -730,6 +794,22 @@ class TestFormattingUtilities:
         result = format_display_time(dt, use_12h_format=False, include_seconds=False)
         assert result == "15:30"
 
+    def test_format_display_time_same_instant_different_timezones(self) -> None:
+        """Test cached formatting keeps timezones of equal instants apart."""
+        utc_dt = datetime(2024, 1, 1, 15, 30, 45, tzinfo=pytz.UTC)
+        ny_dt = utc_dt.astimezone(pytz.timezone("America/New_York"))
+
+        assert format_display_time(utc_dt, use_12h_format=False) == "15:30:45"
+        assert format_display_time(ny_dt, use_12h_format=False) == "10:30:45"
+
+    def test_format_display_time_ignores_microseconds(self) -> None:
+        """Test sub-second differences format identically."""
+        first = datetime(2024, 1, 1, 15, 30, 45, 1000)
+        second = datetime(2024, 1, 1, 15, 30, 45, 999000)
+
+        assert format_display_time(first, False) == format_display_time(second, False)
+        assert format_display_time(second, False, include_seconds=False) == "15:30"
+
     def test_format_display_time_auto_detect(self) -> None:
         """Test format_display_time with automatic format detection."""
         dt = datetime(2024, 1, 1, 15, 30, 45)